@@ -8,7 +8,8 @@ from coffee_lot_management.domain.model.aggregates.coffee_lot import CoffeeLot,
 from coffee_lot_management.domain.model.queries.get_coffee_lot_by_id_query import GetCoffeeLotByIdQuery
 from coffee_lot_management.domain.model.queries.get_coffee_lots_by_producer_query import GetCoffeeLotsByProducerQuery
 from coffee_lot_management.domain.model.queries.get_lot_traceability_query import GetLotTraceabilityQuery
-from coffee_lot_management.domain.model.queries.search_coffee_lots_query import SearchCoffeeLotsQuery
+from coffee_lot_management.domain.model.queries.search_coffee_lots_query import SearchCoffeeLotsQuery, \
+    MAX_SEARCH_LIMIT
 from coffee_lot_management.infrastructure.persistence.database.repositories.coffee_lot_repository import \
     CoffeeLotRepository
 
@@ -54,39 +55,39 @@ class CoffeeLotQueryService:
 
     def handle_search_coffee_lots(self, query: SearchCoffeeLotsQuery) -> list[type[CoffeeLot]]:
         """Búsqueda avanzada de lotes con múltiples criterios"""
-        base_query = self.db.query(CoffeeLot)
-
-        # Aplicar filtros
-        if query.variety:
-            try:
-                variety_enum = CoffeeVariety[query.variety.upper()]
-                base_query = base_query.filter(CoffeeLot.coffee_variety == variety_enum)
-            except KeyError:
-                pass
+        conditions = []
+
+        # Filtros por enumeración: (valor de la query, enum, columna)
+        for value, enum_cls, column in (
+                (query.variety, CoffeeVariety, CoffeeLot.coffee_variety),
+                (query.processing_method, ProcessingMethod, CoffeeLot.processing_method),
+                (query.status, LotStatus, CoffeeLot.status),
+        ):
+            if value:
+                try:
+                    conditions.append(column == enum_cls[value.upper()])
+                except KeyError:
+                    pass
+
+        # Filtros de fecha para harvest_date, comparando la columna directamente para usar el índice
+        if query.start_date and query.end_date:
+            conditions.append(CoffeeLot.harvest_date.between(query.start_date, query.end_date))
+        elif query.start_date:
+            conditions.append(CoffeeLot.harvest_date >= query.start_date)
+        elif query.end_date:
+            conditions.append(CoffeeLot.harvest_date <= query.end_date)
 
-        # FIX: Agregado el filtro de processing_method que faltaba
-        if query.processing_method:
-            try:
-                processing_enum = ProcessingMethod[query.processing_method.upper()]
-                base_query = base_query.filter(CoffeeLot.processing_method == processing_enum)
-            except KeyError:
-                pass
-
-        if query.status:
-            try:
-                status_enum = LotStatus[query.status.upper()]
-                base_query = base_query.filter(CoffeeLot.status == status_enum)
-            except KeyError:
-                pass
-
-        # Filtros de fecha para harvest_date
-        if query.start_date:
-            base_query = base_query.filter(CoffeeLot.harvest_date >= query.start_date)
-
-        if query.end_date:
-            base_query = base_query.filter(CoffeeLot.harvest_date <= query.end_date)
-
-        return base_query.all()
+        base_query = self.db.query(CoffeeLot)
+        if conditions:
+            base_query = base_query.filter(*conditions)
+
+        # Paginación con orden estable y tope máximo de resultados
+        return (
+            base_query.order_by(CoffeeLot.id)
+            .offset(query.skip)
+            .limit(min(query.limit, MAX_SEARCH_LIMIT))
+            .all()
+        )
 
     def handle_get_lot_traceability(self, query: GetLotTraceabilityQuery) -> Optional[CoffeeLot]:
         """Recupera información completa para trazabilidad"""
@@ -1,7 +1,7 @@
 import enum
 from datetime import date
 
-from sqlalchemy import Column, Integer, String, Float, Date, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Date, Enum as SQLEnum, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import Any
 from sqlalchemy.orm import relationship
 
@@ -38,7 +38,14 @@ class CoffeeLot(AuditableAbstractAggregateRoot):
     """
     Agregado CoffeeLot - Gestiona el ciclo de vida de lotes de café
     """
+    # Sin __slots__ ni @dataclass(slots=True): SQLAlchemy guarda el estado de instrumentación
+    # (_sa_instance_state) en el __dict__ de cada instancia y la base declarativa no usa slots,
+    # así que declararlos aquí no reduciría memoria
     __tablename__ = "coffee_lots"
+    __table_args__ = (
+        # Búsqueda avanzada: rango de harvest_date combinado con variedad y estado
+        Index("ix_coffee_lots_harvest_date_variety_status", "harvest_date", "coffee_variety", "status"),
+    )
 
     lot_number = Column(String(50), unique=True, nullable=False, index=True)
     producer_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -1,7 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import date
 from typing import Optional
 
+# Máximo de lotes que puede devolver una página de búsqueda
+MAX_SEARCH_LIMIT = 1000
+
 
 class SearchCoffeeLotsQuery(BaseModel):
     """Query para búsqueda avanzada de lotes"""
@@ -9,4 +12,6 @@ class SearchCoffeeLotsQuery(BaseModel):
     processing_method: Optional[str] = None
     start_date: Optional[date] = None
     end_date: Optional[date] = None
-    status: Optional[str] = None
\ No newline at end of file
+    status: Optional[str] = None
+    skip: int = Field(ge=0, default=0)
+    limit: int = Field(ge=1, le=MAX_SEARCH_LIMIT, default=100)
@@ -15,7 +15,8 @@ from coffee_lot_management.domain.model.commands.register_coffee_lot_command imp
 from coffee_lot_management.domain.model.commands.update_coffee_lot_command import UpdateCoffeeLotCommand
 from coffee_lot_management.domain.model.queries.get_coffee_lot_by_id_query import GetCoffeeLotByIdQuery
 from coffee_lot_management.domain.model.queries.get_coffee_lots_by_producer_query import GetCoffeeLotsByProducerQuery
-from coffee_lot_management.domain.model.queries.search_coffee_lots_query import SearchCoffeeLotsQuery
+from coffee_lot_management.domain.model.queries.search_coffee_lots_query import SearchCoffeeLotsQuery, \
+    MAX_SEARCH_LIMIT
 from shared.domain.database import get_db
 
 router = APIRouter(prefix="/api/v1/coffee-lots", tags=["Coffee Lot Management"])
@@ -192,6 +193,8 @@ async def search_coffee_lots(
         coffee_status: Optional[LotStatusEnum] = Query(None, description="Filtrar por estado del lote"),
         start_date: Optional[date] = Query(None, description="Fecha de cosecha desde (inclusive)"),
         end_date: Optional[date] = Query(None, description="Fecha de cosecha hasta (inclusive)"),
+        skip: int = Query(0, ge=0, description="Número de lotes a omitir"),
+        limit: int = Query(100, ge=1, le=MAX_SEARCH_LIMIT, description="Máximo de lotes a retornar"),
         db: Session = Depends(get_db)
 ):
     """Búsqueda avanzada de lotes de café con múltiples filtros"""
@@ -200,7 +203,9 @@ async def search_coffee_lots(
         processing_method=processing_method.value if processing_method else None,
         status=coffee_status.value if coffee_status else None,
         start_date=start_date,
-        end_date=end_date
+        end_date=end_date,
+        skip=skip,
+        limit=limit
     )
     query_service = CoffeeLotQueryService(db)
     lots = query_service.handle_search_coffee_lots(query)
@@ -4,11 +4,13 @@ Este archivo es automáticamente detectado por pytest y sus fixtures están
 disponibles para todos los archivos de test en el directorio.
 """
 
+import logging
 import pytest
 import numpy as np
+from datetime import date
 import cv2
 from unittest.mock import Mock
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 
 # ============================================================================
 # GRAIN CLASSIFICATION IMPORTS
@@ -32,6 +34,9 @@ from coffee_lot_management.application.internal.queryservices.coffee_lot_query_s
 from coffee_lot_management.domain.services.lot_number_generator_service import (
     LotNumberGeneratorService
 )
+from coffee_lot_management.domain.model.aggregates.coffee_lot import (
+    CoffeeLot, CoffeeVariety, ProcessingMethod
+)
 from coffee_lot_management.infrastructure.persistence.database.repositories.coffee_lot_repository import (
     CoffeeLotRepository
 )
@@ -41,10 +46,11 @@ from coffee_lot_management.infrastructure.persistence.database.repositories.coff
 # FIXTURES DE BASE DE DATOS
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_db_session():
     """
     Simula una sesión de base de datos SQLAlchemy.
+    Se crea una vez por sesión de pytest y se reinicia tras cada test (ver _reset_mocks).
 
     Returns:
         Mock: Objeto mock configurado para simular Session de SQLAlchemy
@@ -57,91 +63,195 @@ def mock_db_session():
     return session
 
 
+class StubQuery:
+    """
+    Consulta SQLAlchemy mínima: filter(), order_by(), offset() y limit() se encadenan
+    sobre sí misma y all() devuelve las filas dadas, sin el coste de crear y registrar
+    Mocks hijos.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def filter(self, *args, **kwargs):
+        return self
+
+    def order_by(self, *args):
+        return self
+
+    def offset(self, offset):
+        return self
+
+    def limit(self, limit):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+@pytest.fixture
+def stub_query():
+    """
+    Fábrica de StubQuery para asignar a mock_db_session.query.return_value.
+
+    Returns:
+        Callable: Función que recibe las filas y retorna un StubQuery
+    """
+    return StubQuery
+
+
+def _build_query_mock(rows):
+    """Crea un Mock(spec=Query) cuyos métodos encadenables retornan el mismo mock y all() las filas dadas."""
+    query = Mock(spec=Query)
+    query.filter.return_value = query
+    query.order_by.return_value = query
+    query.offset.return_value = query
+    query.limit.return_value = query
+    query.all.return_value = rows
+    return query
+
+
+@pytest.fixture
+def build_query_mock():
+    """
+    Fábrica de consultas mockeadas para tests que verifican las llamadas a la consulta
+    (filter, limit, ...); si solo importan las filas, usar stub_query.
+
+    Returns:
+        Callable: Función que recibe las filas y retorna un Mock(spec=Query)
+    """
+    return _build_query_mock
+
+
 # ============================================================================
 # FIXTURES DE SERVICIOS DE INFRAESTRUCTURA - GRAIN CLASSIFICATION
 # ============================================================================
 
-@pytest.fixture
+def _build_test_image(size):
+    """Construye una imagen BGR de solo lectura de size x size pixels, color café."""
+    test_image = np.zeros((size, size, 3), dtype=np.uint8)
+    test_image[:, :] = [139, 69, 19]  # Color café en BGR
+    test_image.setflags(write=False)
+    return test_image
+
+
+# Imagen decodificada que retorna el CV mockeado; se construye una sola vez
+_CV_TEST_IMAGE = _build_test_image(100)
+
+# Contorno cuadrado de solo lectura compartido por los granos segmentados
+_CV_TEST_CONTOUR = np.array([[10, 10], [90, 10], [90, 90], [10, 90]])
+_CV_TEST_CONTOUR.setflags(write=False)
+
+# Segmentación por defecto (2 granos); cada test recibe una copia superficial
+_SEGMENTED_BEANS_TEMPLATE = tuple(
+    {'image': _CV_TEST_IMAGE, 'contour': _CV_TEST_CONTOUR}
+    for _ in range(2)
+)
+
+# Características de un grano promedio, sin defectos
+_DEFAULT_BEAN_FEATURES = {
+    'area': 1500.0,
+    'perimeter': 200.0,
+    'circularity': 0.85,
+    'has_cracks': 'False'
+}
+
+
+def _configure_cv_service(cv_service):
+    """Aplica el comportamiento por defecto del servicio de CV mockeado."""
+    cv_service.load_image_from_bytes.return_value = _CV_TEST_IMAGE
+
+    # Simular segmentación de granos a partir de la plantilla precalculada
+    cv_service.segment_beans.return_value = list(_SEGMENTED_BEANS_TEMPLATE)
+
+    # Simular extracción de características (grano promedio, sin defectos)
+    cv_service.extract_all_features.return_value = dict(_DEFAULT_BEAN_FEATURES)
+
+
+@pytest.fixture(scope="session")
 def mock_cv_service():
     """
     Simula el servicio de Computer Vision.
     Configura respuestas por defecto para segmentación y extracción de características.
+    Se crea una vez por sesión y se reinicia tras cada test (ver _reset_mocks).
 
     Returns:
         Mock: CVService mockeado con comportamiento predeterminado
     """
     cv_service = Mock(spec=CVService)
+    _configure_cv_service(cv_service)
+    return cv_service
 
-    # Simular imagen de prueba (100x100 pixels, BGR)
-    test_image = np.zeros((100, 100, 3), dtype=np.uint8)
-    test_image[:, :] = [139, 69, 19]  # Color café en BGR
-
-    cv_service.load_image_from_bytes.return_value = test_image
-
-    # Simular segmentación de granos (2 granos por defecto)
-    cv_service.segment_beans.return_value = [
-        {
-            'image': test_image,
-            'contour': np.array([[10, 10], [90, 10], [90, 90], [10, 90]])
-        },
-        {
-            'image': test_image,
-            'contour': np.array([[10, 10], [90, 10], [90, 90], [10, 90]])
-        }
-    ]
 
-    # Simular extracción de características (grano promedio, sin defectos)
-    cv_service.extract_all_features.return_value = {
-        'area': 1500.0,
-        'perimeter': 200.0,
-        'circularity': 0.85,
-        'has_cracks': 'False'
+def _configure_ml_predictor(ml_predictor):
+    """Aplica el comportamiento por defecto del predictor ML mockeado."""
+    # Simular predicción de colores (grano de calidad premium por defecto)
+    ml_predictor.predict_color_percentages.return_value = {
+        'Light': 5.0,
+        'Medium': 85.0,  # Clase predominante -> Premium
+        'Dark': 5.0,
+        'Green': 5.0
     }
 
-    return cv_service
+    # La predicción por lote delega en predict_color_percentages grano a grano, así los
+    # tests pueden seguir configurando la respuesta por grano (return_value/side_effect)
+    ml_predictor.predict_color_percentages_batch.side_effect = (
+        lambda images: [ml_predictor.predict_color_percentages(image) for image in images]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ml_predictor():
     """
     Simula el servicio de predicción de Machine Learning.
     Configura predicciones por defecto para clasificación de color.
+    Se crea una vez por sesión y se reinicia tras cada test (ver _reset_mocks).
 
     Returns:
         Mock: MLPredictorService mockeado con predicciones de calidad premium
     """
     ml_predictor = Mock(spec=MLPredictorService)
-
-    # Simular predicción de colores (grano de calidad premium por defecto)
-    ml_predictor.predict_color_percentages.return_value = {
-        'Light': 5.0,
-        'Medium': 85.0,  # Clase predominante -> Premium
-        'Dark': 5.0,
-        'Green': 5.0
-    }
-
+    _configure_ml_predictor(ml_predictor)
     return ml_predictor
 
 
 @pytest.fixture
-def mock_cloudinary_service():
+def color_prediction(request, mock_ml_predictor):
     """
-    Simula el servicio de Cloudinary para almacenamiento de imágenes.
+    Configura la predicción de color por grano del predictor ML mockeado.
+    Se usa con parametrización indirecta: cada caso pasa sus porcentajes de color
+    como parámetro y el mock queda configurado antes de ejecutar el test.
 
     Returns:
-        Mock: CloudinaryService mockeado con URLs de prueba
+        Mock: MLPredictorService mockeado con la predicción del caso
     """
-    cloudinary_service = Mock(spec=CloudinaryService)
+    mock_ml_predictor.predict_color_percentages.return_value = request.param
+    return mock_ml_predictor
 
+
+def _configure_cloudinary_service(cloudinary_service):
+    """Aplica el comportamiento por defecto del servicio de Cloudinary mockeado."""
     cloudinary_service.upload_grain_image.return_value = {
         'url': 'https://cloudinary.com/test-image.jpg',
         'public_id': 'grains/test_session/grain_0'
     }
 
+
+@pytest.fixture(scope="session")
+def mock_cloudinary_service():
+    """
+    Simula el servicio de Cloudinary para almacenamiento de imágenes.
+    Se crea una vez por sesión y se reinicia tras cada test (ver _reset_mocks).
+
+    Returns:
+        Mock: CloudinaryService mockeado con URLs de prueba
+    """
+    cloudinary_service = Mock(spec=CloudinaryService)
+    _configure_cloudinary_service(cloudinary_service)
     return cloudinary_service
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def grading_service():
     """
     Servicio de calificación real (no mock).
@@ -157,16 +267,8 @@ def grading_service():
 # FIXTURES DE REPOSITORIOS - COFFEE LOT MANAGEMENT
 # ============================================================================
 
-@pytest.fixture
-def mock_coffee_lot_repository():
-    """
-    Simula el repositorio de lotes de café.
-
-    Returns:
-        Mock: CoffeeLotRepository mockeado con operaciones CRUD
-    """
-    repository = Mock(spec=CoffeeLotRepository)
-
+def _configure_coffee_lot_repository(repository):
+    """Aplica el comportamiento por defecto del repositorio de lotes mockeado."""
     # Configurar save() para retornar el objeto que recibe (comportamiento típico de repositorios)
     def save_side_effect(coffee_lot):
         # Simular asignación de ID si no tiene uno
@@ -181,23 +283,64 @@ def mock_coffee_lot_repository():
     repository.exists_by_lot_number.return_value = False
     repository.delete.return_value = None
 
+
+@pytest.fixture(scope="session")
+def mock_coffee_lot_repository():
+    """
+    Simula el repositorio de lotes de café.
+    Se crea una vez por sesión de pytest y se reinicia tras cada test (ver _reset_mocks).
+
+    Returns:
+        Mock: CoffeeLotRepository mockeado con operaciones CRUD
+    """
+    repository = Mock(spec=CoffeeLotRepository)
+    _configure_coffee_lot_repository(repository)
     return repository
 
 
+# Con pytest-xdist cada worker es un proceso con su propia sesión de pytest: los mocks de
+# alcance de sesión ya son uno por worker y nunca se comparten entre procesos
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_db_session, mock_coffee_lot_repository, mock_cv_service, mock_ml_predictor,
+                 mock_cloudinary_service, mock_lot_number_service):
+    """
+    Reinicia los mocks de alcance de sesión después de cada test, incluyendo
+    return_value/side_effect configurados por el test, y restaura los valores por defecto.
+    """
+    yield
+    for mock, configure in (
+            (mock_db_session, None),
+            (mock_coffee_lot_repository, _configure_coffee_lot_repository),
+            (mock_cv_service, _configure_cv_service),
+            (mock_ml_predictor, _configure_ml_predictor),
+            (mock_cloudinary_service, _configure_cloudinary_service),
+            (mock_lot_number_service, _configure_lot_number_service),
+    ):
+        mock.reset_mock(return_value=True, side_effect=True)
+        if configure is not None:
+            configure(mock)
+
+
 # ============================================================================
 # FIXTURES DE SERVICIOS DE DOMINIO - COFFEE LOT MANAGEMENT
 # ============================================================================
 
-@pytest.fixture
+def _configure_lot_number_service(service):
+    """Aplica el comportamiento por defecto del generador de números de lote mockeado."""
+    service.generate_lot_number.return_value = "LOT-2024-0001"
+
+
+@pytest.fixture(scope="session")
 def mock_lot_number_service():
     """
     Simula el servicio de generación de números de lote.
+    Se crea una vez por sesión y se reinicia tras cada test (ver _reset_mocks).
 
     Returns:
         Mock: LotNumberGeneratorService mockeado
     """
     service = Mock(spec=LotNumberGeneratorService)
-    service.generate_lot_number.return_value = "LOT-2024-0001"
+    _configure_lot_number_service(service)
     return service
 
 
@@ -205,7 +348,7 @@ def mock_lot_number_service():
 # FIXTURES DE SERVICIOS DE APLICACIÓN - GRAIN CLASSIFICATION
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def classification_service(mock_db_session, mock_cv_service, mock_ml_predictor,
                            grading_service, mock_cloudinary_service):
     """
@@ -230,7 +373,70 @@ def classification_service(mock_db_session, mock_cv_service, mock_ml_predictor,
     )
 
 
+@pytest.fixture(scope="session")
+def run_session(classification_service, sample_image_bytes):
+    """
+    Fábrica que ejecuta una sesión de clasificación con los valores comunes a los tests.
+    Los mocks deben configurarse antes de invocarla.
+
+    Returns:
+        Callable[..., ClassificationSession]: Función que acepta overrides de
+            coffee_lot_id, user_id e image_bytes
+    """
+    def _run(coffee_lot_id=1, user_id=1, image_bytes=None):
+        return classification_service.start_classification_session(
+            coffee_lot_id=coffee_lot_id,
+            image_bytes=sample_image_bytes if image_bytes is None else image_bytes,
+            user_id=user_id
+        )
+
+    return _run
+
+
 @pytest.fixture
+def completed_session(run_session):
+    """
+    Sesión de clasificación ejecutada con los mocks por defecto.
+    Para tests que no reconfiguran los mocks antes de clasificar.
+
+    Returns:
+        ClassificationSession: Sesión procesada
+    """
+    return run_session()
+
+
+@pytest.fixture(scope="class")
+def default_run(run_session, mock_db_session, mock_cloudinary_service):
+    """
+    Sesión de clasificación con los mocks por defecto, compartida por toda la clase,
+    junto con las llamadas que registraron los mocks al procesarla. Las llamadas se
+    copian al crearla porque _reset_mocks las borra tras cada test.
+
+    Returns:
+        tuple: (ClassificationSession, llamadas a la sesión de BD como
+            mock_db_session.method_calls, nº de subidas de imágenes a Cloudinary)
+    """
+    session = run_session()
+    return (
+        session,
+        tuple(mock_db_session.method_calls),
+        mock_cloudinary_service.upload_grain_image.call_count,
+    )
+
+
+@pytest.fixture(scope="class")
+def default_session(default_run):
+    """
+    Sesión de clasificación con los mocks por defecto, compartida por toda la clase.
+    Solo para tests de lectura del agregado; las llamadas a los mocks están en default_run.
+
+    Returns:
+        ClassificationSession: Sesión procesada
+    """
+    return default_run[0]
+
+
+@pytest.fixture(scope="session")
 def query_service(mock_db_session):
     """
     Servicio de consultas configurado con base de datos mockeada.
@@ -248,7 +454,7 @@ def query_service(mock_db_session):
 # FIXTURES DE SERVICIOS DE APLICACIÓN - COFFEE LOT MANAGEMENT
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def coffee_lot_command_service(mock_db_session, mock_coffee_lot_repository, mock_lot_number_service):
     """
     Servicio de comandos para Coffee Lot configurado con dependencias mockeadas.
@@ -267,7 +473,7 @@ def coffee_lot_command_service(mock_db_session, mock_coffee_lot_repository, mock
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def coffee_lot_query_service(mock_db_session, mock_coffee_lot_repository):
     """
     Servicio de consultas para Coffee Lot configurado con dependencias mockeadas.
@@ -288,32 +494,95 @@ def coffee_lot_query_service(mock_db_session, mock_coffee_lot_repository):
 # FIXTURES DE DATOS DE PRUEBA
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image_bytes():
     """
     Genera bytes de imagen JPEG de prueba para usar en tests.
+    Se codifica una sola vez por sesión; los bytes son inmutables.
 
     Returns:
         bytes: Imagen codificada en JPEG como bytes
     """
     # Crear imagen de prueba (200x200 pixels, color café)
-    test_image = np.zeros((200, 200, 3), dtype=np.uint8)
-    test_image[:, :] = [139, 69, 19]  # Color café en BGR
+    test_image = _build_test_image(200)
 
     # Codificar como JPEG
     _, buffer = cv2.imencode('.jpg', test_image)
     return buffer.tobytes()
 
 
+@pytest.fixture(scope="session")
+def sample_image_bytes_invalid():
+    """
+    Bytes que no corresponden a ninguna imagen decodificable.
+    Constante trivial: los tests de error no necesitan codificar una imagen real.
+
+    Returns:
+        bytes: Datos de imagen corruptos
+    """
+    return b'invalid_data'
+
+
+@pytest.fixture(scope="session")
+def coffee_lot_factory():
+    """
+    Fábrica de lotes de café con valores por defecto comunes a los tests.
+    Se construye una sola vez por sesión; cada llamada retorna un CoffeeLot nuevo.
+
+    Returns:
+        Callable[..., CoffeeLot]: Función que acepta overrides de los campos del lote
+            (incluyendo 'id' y 'status')
+    """
+    defaults = dict(
+        lot_number="LOT-2024-0001",
+        producer_id=1,
+        harvest_date=date(2024, 5, 15),
+        coffee_variety=CoffeeVariety.TYPICA,
+        quantity=500.0,
+        processing_method=ProcessingMethod.WASHED,
+        latitude=-12.0464,
+        longitude=-77.0428
+    )
+
+    def _make(status=None, **overrides):
+        coffee_lot = CoffeeLot(**{**defaults, **overrides})
+        # CoffeeLot.__init__ siempre inicia en REGISTERED
+        if status is not None:
+            coffee_lot.status = status
+        return coffee_lot
+
+    return _make
+
+
 # ============================================================================
 # CONFIGURACIÓN DE PYTEST
 # ============================================================================
 
+# Loggers de tests cuyo nivel INFO solo se emite al pedir log_cli_level explícitamente
+# (--log-cli-level en la línea de comandos o log_cli_level en pytest.ini)
+QUIET_TEST_LOGGERS = (
+    "us_06_integration_test",
+    "us_07_integration_test",
+    "us_08_integration_test",
+    "us_09_integration_test",
+    "us_10_integration_test",
+    "us_11_integration_test",
+    "us_12_integration_test",
+    "us_13_integration_test",
+    "us_14_integration_test",
+)
+
+
 def pytest_configure(config):
     """
     Configuración global de pytest.
-    Registra markers personalizados para categorizar tests.
+    Registra markers personalizados para categorizar tests y silencia los logs
+    INFO de los tests basados solo en mocks (usar --log-cli-level=INFO para verlos).
     """
+    if config.getoption("log_cli_level") is None and not config.getini("log_cli_level"):
+        for logger_name in QUIET_TEST_LOGGERS:
+            logging.getLogger(logger_name).setLevel(logging.WARNING)
+
     # Markers para User Stories de Grain Classification
     config.addinivalue_line(
         "markers", "us12: Tests para User Story 12 - Detección de Defectos"
@@ -48,20 +48,32 @@ class ClassificationApplicationService:
 
             bean_assessments_for_report = []
 
-            # 3. Bucle de análisis de granos
-            for idx, bean_data in enumerate(beans_data):
+            # 3. Extraer características y preparar la entrada del modelo de cada grano
+            bean_features = []
+            model_inputs = []
+            for bean_data in beans_data:
                 bean_image = bean_data['image']
                 contour = bean_data['contour']
 
-                features = self.cv_service.extract_all_features(bean_image, contour)
+                bean_features.append(self.cv_service.extract_all_features(bean_image, contour))
 
                 rgb_image_for_model = cv2.cvtColor(bean_image, cv2.COLOR_BGR2RGB)
-                model_input = cv2.resize(rgb_image_for_model, (224, 224))
+                model_inputs.append(cv2.resize(rgb_image_for_model, (224, 224)))
+
+            # 4. Predecir todos los granos en una sola llamada (Infraestructura IA)
+            batch_percentages = self.ml_predictor.predict_color_percentages_batch(model_inputs)
+            if batch_percentages is None or any(p is None for p in batch_percentages):
+                raise Exception("Modelo CNN no disponible o falló la predicción.")
+            if len(batch_percentages) != len(model_inputs):
+                raise Exception(
+                    f"El modelo CNN devolvió {len(batch_percentages)} predicciones "
+                    f"para {len(model_inputs)} granos."
+                )
 
-                # 4. Predecir (Infraestructura IA)
-                color_percentages = self.ml_predictor.predict_color_percentages(model_input)
-                if color_percentages is None:
-                    raise Exception("Modelo CNN no disponible o falló la predicción.")
+            # Bucle de análisis de granos
+            for idx, (bean_data, features, color_percentages) in enumerate(
+                    zip(beans_data, bean_features, batch_percentages, strict=True)):
+                bean_image = bean_data['image']
 
                 # 5. Obtener puntuación base (Dominio)
                 winning_class = max(color_percentages, key=color_percentages.get)
@@ -49,4 +49,4 @@ class ClassificationSession(AuditableAbstractAggregateRoot):
     def fail(self, reason: str):
         self.status = SessionStatus.FAILED
         self.classification_result = {"error": reason}
-        self.completed_at = datetime.now(UTC)
\ No newline at end of file
+        self.completed_at = datetime.now(UTC)
@@ -13,6 +13,9 @@ class MLPredictorService:
     2. Si falla, descarga desde Blob Storage
     """
 
+    # Granos por pasada del modelo en la predicción por lote (acota la memoria del tensor)
+    PREDICT_BATCH_SIZE = 32
+
     def __init__(self, model_path: str, color_classes: list[str]):
         self.model_path = model_path
         self.color_classes = color_classes
@@ -116,6 +119,20 @@ class MLPredictorService:
             print(f"❌ CRÍTICO: Error al cargar modelo después de descarga: {e}")
             return None
 
+    def _to_percentages(self, raw_predictions: np.ndarray) -> dict:
+        """Convierte la salida cruda del modelo en porcentajes por clase de color (suma 100%)."""
+        # Convertir a diccionario
+        predictions = {}
+        for i, color_class in enumerate(self.color_classes):
+            predictions[color_class] = round(raw_predictions[i].item(), 3)
+
+        # Normalizar a 100%
+        total_prob = sum(predictions.values())
+        if total_prob > 0:
+            predictions = {k: (v / total_prob) * 100 for k, v in predictions.items()}
+
+        return predictions
+
     def predict_color_percentages(self, processed_image: np.ndarray) -> dict | None:
         """
         Predice los porcentajes de confianza para cada clase de color.
@@ -132,18 +149,37 @@ class MLPredictorService:
             # Predicción
             raw_predictions = self.cnn_model.predict(input_tensor, verbose=0)[0]
 
-            # Convertir a diccionario
-            predictions = {}
-            for i, color_class in enumerate(self.color_classes):
-                predictions[color_class] = round(raw_predictions[i].item(), 3)
+            return self._to_percentages(raw_predictions)
 
-            # Normalizar a 100%
-            total_prob = sum(predictions.values())
-            if total_prob > 0:
-                predictions = {k: (v / total_prob) * 100 for k, v in predictions.items()}
+        except Exception as e:
+            print(f"❌ Error durante predicción CNN: {e}")
+            return None
 
-            return predictions
+    def predict_color_percentages_batch(self, processed_images: list[np.ndarray]) -> list[dict] | None:
+        """
+        Predice los porcentajes de color de varios granos en una sola pasada del modelo.
+        Retorna un diccionario por imagen, en el mismo orden recibido.
+        """
+        if self.cnn_model is None:
+            print("❌ Modelo no disponible para predicción")
+            return None
+
+        if not processed_images:
+            return []
+
+        try:
+            results = []
+            for start in range(0, len(processed_images), self.PREDICT_BATCH_SIZE):
+                # Normalizar un bloque de granos (n, 224, 224, 3) en float32, sin copia float64
+                input_tensor = np.stack(processed_images[start:start + self.PREDICT_BATCH_SIZE]).astype(np.float32)
+                input_tensor /= 255.0
+
+                # Predicción
+                raw_batch = self.cnn_model.predict(input_tensor, verbose=0)
+                results.extend(self._to_percentages(raw_predictions) for raw_predictions in raw_batch)
+
+            return results
 
         except Exception as e:
-            print(f"❌ Error durante predicción CNN: {e}")
-            return None
\ No newline at end of file
+            print(f"❌ Error durante predicción CNN por lote: {e}")
+            return None
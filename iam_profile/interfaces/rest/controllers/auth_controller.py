@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from datetime import datetime, timedelta, UTC
 from jose import jwt
 from shared.domain.database import get_db
-from shared.infrastructure.persistence.database.repositories.settings import settings
+from shared.infrastructure.persistence.database.repositories.settings import Settings, get_settings
 from iam_profile.interfaces.rest.resources.register_producer_resource import RegisterProducerResource
 from iam_profile.interfaces.rest.resources.register_cooperative_resource import RegisterCooperativeResource
 from iam_profile.interfaces.rest.resources.user_resource import UserResource
@@ -18,15 +18,15 @@ from iam_profile.application.internal.queryservices.user_query_service import Us
 router = APIRouter(prefix="/api/v1/auth", tags=["Authentication"])
 
 
-def create_access_token(data: dict, expires_delta: timedelta = None):
-    """Crea un token JWT"""
+def create_access_token(data: dict, app_settings: Settings, expires_delta: timedelta = None):
+    """Crea un token JWT firmado con la clave y el algoritmo de la configuración dada"""
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.now(UTC) + expires_delta
     else:
         expire = datetime.now(UTC) + timedelta(minutes=15)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, app_settings.SECRET_KEY, algorithm=app_settings.ALGORITHM)
     return encoded_jwt
 
 
@@ -38,7 +38,8 @@ async def register_producer(
     """
     Registra un nuevo productor independiente
     """
-    command = RegisterProducerCommand(**resource.model_dump())
+    # El resource ya aplicó las mismas restricciones que el command: evitar una segunda validación
+    command = RegisterProducerCommand.model_construct(**resource.model_dump())
     command_service = UserCommandService(db)
     user = command_service.handle_register_producer(command)
     return UserResource.model_validate(user)
@@ -61,7 +62,8 @@ async def register_cooperative(
 @router.post("/login", response_model=LoginResponse)
 async def login(
         login_request: LoginRequest,
-        db: Session = Depends(get_db)
+        db: Session = Depends(get_db),
+        app_settings: Settings = Depends(get_settings)
 ):
     """
     Inicia sesión con email y contraseña
@@ -88,9 +90,10 @@ async def login(
             )
 
         # Crear token de acceso
-        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        access_token_expires = timedelta(minutes=app_settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
             data={"sub": user.email, "user_id": user.id, "user_type": user.user_type.value},
+            app_settings=app_settings,
             expires_delta=access_token_expires
         )
 
@@ -0,0 +1,12 @@
+from functools import lru_cache
+
+from email_validator import EmailNotValidError, validate_email
+
+
+@lru_cache(maxsize=8192)
+def valid_email(email: str) -> str:
+    """Valida y normaliza un email, cacheando el resultado por valor crudo"""
+    try:
+        return validate_email(email, check_deliverability=False).normalized
+    except EmailNotValidError as e:
+        raise ValueError(f"value is not a valid email address: {e}")
@@ -1,7 +1,13 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, Field, field_validator
+from iam_profile.interfaces.rest.resources.email_validators import valid_email
 
 
 class LoginRequest(BaseModel):
     """Resource para login"""
-    email: EmailStr
-    password: str
\ No newline at end of file
+    email: str = Field(json_schema_extra={"format": "email"})
+    password: str
+
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, value: str) -> str:
+        return valid_email(value)
@@ -1,10 +1,11 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List
+from iam_profile.interfaces.rest.resources.email_validators import valid_email
 
 
 class RegisterProducerResource(BaseModel):
     """Resource para registro de productor"""
-    email: EmailStr
+    email: str = Field(json_schema_extra={"format": "email"})
     password: str = Field(min_length=8)
     first_name: str = Field(min_length=2, max_length=100)
     last_name: str = Field(min_length=2, max_length=100)
@@ -20,4 +21,9 @@ class RegisterProducerResource(BaseModel):
     region: str
     hectares: float = Field(gt=0)
     coffee_varieties: Optional[List[str]] = None
-    production_capacity: Optional[int] = None
\ No newline at end of file
+    production_capacity: Optional[int] = None
+
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, value: str) -> str:
+        return valid_email(value)
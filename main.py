@@ -1,3 +1,4 @@
+import logging
 import os
 import sys
 
@@ -7,6 +8,7 @@ os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 from shared.infrastructure.persistence.database.repositories.settings import settings
 from shared.domain.database import init_db
@@ -16,6 +18,13 @@ from iam_profile.interfaces.rest.controllers.user_controller import router as us
 from coffee_lot_management.interfaces.rest.controllers.coffee_lot_controller import router as coffee_lot_router
 from grain_classification.interfaces.rest.controllers.classification_controller import router as classification_router
 
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(message)s",
+    handlers=[logging.StreamHandler()],
+)
+logger = logging.getLogger("beandetect")
+
 # Backend configuration
 BACKEND_URL = os.environ.get(
     "BACKEND_URL",
@@ -25,24 +34,31 @@ BACKEND_URL = os.environ.get(
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     """Eventos de inicio y cierre del ciclo de vida de la aplicación"""
-    print("=" * 60)
-    print("🚀 Iniciando BeanDetect AI Backend")
-    print("=" * 60)
+    logger.info("\n".join([
+        "=" * 60,
+        "🚀 Iniciando BeanDetect AI Backend",
+        "=" * 60,
+        "[1/1] Inicializando base de datos...",
+    ]))
 
     # Startup - Base de datos
-    print("\n[1/1] Inicializando base de datos...")
     init_db()
-    print("Base de datos inicializada")
 
-    print("\n" + "=" * 60)
-    print(f"{settings.PROJECT_NAME} está corriendo")
-    print(f"Documentación: http://localhost:8000/docs")
-    print("=" * 60 + "\n")
+    # Precalcular esquema OpenAPI antes de la primera petición
+    _app.openapi()
+
+    logger.info("\n".join([
+        "Base de datos inicializada",
+        "=" * 60,
+        f"{settings.PROJECT_NAME} está corriendo",
+        "Documentación: http://localhost:8000/docs",
+        "=" * 60,
+    ]))
 
     yield  # Aquí FastAPI empieza a aceptar peticiones
 
     # Shutdown
-    print("\n🛑 Apagando servidor...")
+    logger.info("🛑 Apagando servidor...")
 
 
 # Crear aplicación FastAPI (usando lifespan)
@@ -54,15 +70,34 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# Configurar CORS
+# Comprimir respuestas (nivel 1: casi la misma tasa que nivel 6 en JSON con menos CPU)
 app.add_middleware(
-    CORSMiddleware, # type: ignore
-    allow_origins=settings.BACKEND_CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    GZipMiddleware, # type: ignore
+    minimum_size=512,
+    compresslevel=1,
 )
 
+# Configurar CORS
+if settings.BACKEND_CORS_ORIGINS == ["*"]:
+    # Comodín: sin credenciales (el token JWT viaja en el header Authorization), así
+    # Starlette responde con "*" sin reflejar el Origin ni añadir "Vary: Origin"
+    app.add_middleware(
+        CORSMiddleware, # type: ignore
+        allow_origins=["*"],
+        allow_origin_regex=None,
+        allow_credentials=False,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+else:
+    app.add_middleware(
+        CORSMiddleware, # type: ignore
+        allow_origins=frozenset(settings.BACKEND_CORS_ORIGINS),
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
 # Incluir routers
 app.include_router(auth_router)
 app.include_router(profile_router)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -38,4 +40,10 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-settings = Settings()
\ No newline at end of file
+@lru_cache
+def get_settings() -> Settings:
+    """Retorna la única instancia de Settings del proceso"""
+    return Settings()
+
+
+settings = get_settings()
\ No newline at end of file
@@ -9,83 +9,148 @@ Ejecutar todos los tests de esta US:
     pytest us_07_integration_test.py -v
 
 Ejecutar un test específico:
-    pytest us_07_integration_test.py::TestUS07EdicionInformacionLote::test_actualizar_cantidad_lote -v
+    pytest us_07_integration_test.py::TestUS07EdicionInformacionLote::test_actualizar_campo_lote -v
 """
 
 import pytest
 import logging
 from datetime import date
 from coffee_lot_management.domain.model.aggregates.coffee_lot import (
-    CoffeeLot, LotStatus, CoffeeVariety, ProcessingMethod
+    LotStatus, CoffeeVariety, ProcessingMethod
 )
 from coffee_lot_management.domain.model.commands.update_coffee_lot_command import UpdateCoffeeLotCommand
 
+pytestmark = [pytest.mark.us07, pytest.mark.integration]
+
 logger = logging.getLogger(__name__)
 
+# Miembros de enum usados por los lotes de prueba
+_CATURRA = CoffeeVariety.CATURRA
+_BOURBON = CoffeeVariety.BOURBON
+_WASHED = ProcessingMethod.WASHED
+_NATURAL = ProcessingMethod.NATURAL
+_HONEY = ProcessingMethod.HONEY
+_CLASSIFIED = LotStatus.CLASSIFIED
+
+# Fechas de cosecha reutilizadas por los lotes de prueba
+_HARVEST_2024_05_15 = date(2024, 5, 15)
+
+# Lotes existentes que wired_repo registra en el repositorio mockeado
+_BOURBON_LOT = dict(
+    id=1,
+    lot_number="LOT-2024-0001",
+    producer_id=1,
+    harvest_date=_HARVEST_2024_05_15,
+    coffee_variety=_BOURBON,
+    quantity=500.0,
+    processing_method=_WASHED
+)
+_CLASSIFIED_LOT = dict(
+    id=2,
+    lot_number="LOT-2024-0002",
+    producer_id=1,
+    harvest_date=_HARVEST_2024_05_15,
+    coffee_variety=_CATURRA,
+    quantity=400.0,
+    processing_method=_NATURAL,
+    status=_CLASSIFIED
+)
+
+
+@pytest.fixture
+def wired_repo(request, mock_coffee_lot_repository, coffee_lot_factory):
+    """
+    Crea el lote descrito por request.param y lo deja precargado en
+    find_by_id() del repositorio mockeado (uso con indirect=True). save() ya
+    devuelve el lote recibido por el side_effect por defecto del repositorio.
+
+    Returns:
+        CoffeeLot: Lote existente que retornará el repositorio
+    """
+    lot = coffee_lot_factory(**request.param)
+    mock_coffee_lot_repository.find_by_id.return_value = lot
+    return lot
+
 
-@pytest.mark.us07
-@pytest.mark.integration
 class TestUS07EdicionInformacionLote:
     """
     Suite de tests de integración para la edición de información de lotes.
     """
 
-    def test_actualizar_cantidad_lote(
+    @pytest.mark.parametrize("field,value,expected", [
+        ("quantity", 600.0, 600.0),
+        ("processing_method", "HONEY", _HONEY),
+        ("altitude", 1650.0, 1650.0),
+    ], ids=["quantity", "processing_method", "altitude"])
+    @pytest.mark.parametrize("wired_repo", [_BOURBON_LOT], indirect=True, ids=["bourbon"])
+    def test_actualizar_campo_lote(
             self,
+            field,
+            value,
+            expected,
             coffee_lot_command_service,
-            mock_coffee_lot_repository
+            wired_repo
     ):
         """
-        Verifica que se pueda actualizar la cantidad de un lote existente.
+        Verifica que se pueda actualizar un campo editable de un lote existente.
 
-        GIVEN un lote registrado con cantidad inicial
-        WHEN se actualiza la cantidad
-        THEN debe reflejarse el cambio correctamente
+        GIVEN un lote registrado con valores iniciales
+        WHEN se actualiza uno de sus campos editables
+        THEN debe reflejarse el cambio en ese campo
         """
-        logger.info("=== TEST: Actualizar cantidad de lote ===")
-
-        # Arrange: Crear lote existente
-        logger.info("ARRANGE: Creando lote existente para edicion")
-        existing_lot = CoffeeLot(
-            lot_number="LOT-2024-0001",
-            producer_id=1,
-            harvest_date=date(2024, 5, 15),
-            coffee_variety=CoffeeVariety.TYPICA,
-            quantity=500.0,
-            processing_method=ProcessingMethod.WASHED,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        existing_lot.id = 1
-        logger.info(f"Lote existente: ID={existing_lot.id}, cantidad original={existing_lot.quantity}kg")
+        logger.info("=== TEST: Actualizar campo '%s' de lote ===", field)
 
-        mock_coffee_lot_repository.find_by_id.return_value = existing_lot
-        mock_coffee_lot_repository.save.return_value = existing_lot
+        # Arrange: Lote existente precargado en el repositorio (wired_repo)
+        logger.info("Lote existente: ID=%s, %s original=%s", wired_repo.id, field, getattr(wired_repo, field))
 
-        command = UpdateCoffeeLotCommand(
-            lot_id=1,
-            quantity=600.0
-        )
-        logger.info(f"Nueva cantidad a actualizar: {command.quantity}kg")
+        command = UpdateCoffeeLotCommand(lot_id=1, **{field: value})
+        logger.info("Nuevo valor a aplicar: %s=%s", field, value)
 
         # Act: Actualizar lote
-        logger.info("ACT: Actualizando cantidad del lote")
+        logger.info("ACT: Actualizando lote")
         updated_lot = coffee_lot_command_service.handle_update_coffee_lot(command)
-        logger.info(f"Lote actualizado: nueva cantidad={updated_lot.quantity}kg")
+        logger.info("Lote actualizado: %s=%s", field, getattr(updated_lot, field))
 
         # Assert: Verificar actualización
         logger.info("ASSERT: Verificando actualizacion exitosa")
-        assert updated_lot.quantity == 600.0, "La cantidad debe haberse actualizado"
-        logger.info("OK: Cantidad actualizada correctamente")
+        assert getattr(updated_lot, field) == expected, \
+            f"El campo '{field}' debe haberse actualizado"
+        logger.info("OK: Campo actualizado correctamente")
+
+    @pytest.mark.parametrize("wired_repo", [_BOURBON_LOT], indirect=True, ids=["bourbon"])
+    def test_actualizacion_preserva_identidad(
+            self,
+            coffee_lot_command_service,
+            wired_repo
+    ):
+        """
+        Verifica que actualizar un lote no altere su identidad ni los campos no editados.
+
+        GIVEN un lote registrado con valores iniciales
+        WHEN se actualiza uno de sus campos editables
+        THEN el ID, el número de lote y la variedad deben mantenerse
+        """
+        logger.info("=== TEST: Actualizacion preserva identidad del lote ===")
+
+        command = UpdateCoffeeLotCommand(lot_id=1, quantity=600.0)
+
+        # Act: Actualizar lote
+        logger.info("ACT: Actualizando cantidad del lote")
+        updated_lot = coffee_lot_command_service.handle_update_coffee_lot(command)
 
+        # Assert: Verificar identidad
+        logger.info("ASSERT: Verificando identidad del lote")
         assert updated_lot.id == 1, "Debe ser el mismo lote"
         assert updated_lot.lot_number == "LOT-2024-0001", "El número de lote no debe cambiar"
-        logger.info("OK: Identidad del lote preservada")
+        assert updated_lot.coffee_variety == _BOURBON, \
+            "Otros campos no deben cambiar"
+        logger.info("OK: Identidad y demas campos del lote preservados")
 
+    @pytest.mark.parametrize("wired_repo", [_CLASSIFIED_LOT], indirect=True, ids=["classified"])
     def test_no_permitir_edicion_lote_clasificado(
             self,
             coffee_lot_command_service,
-            mock_coffee_lot_repository
+            wired_repo
     ):
         """
         Verifica que no se permita editar lotes que ya fueron clasificados.
@@ -96,23 +161,8 @@ class TestUS07EdicionInformacionLote:
         """
         logger.info("=== TEST: No permitir edicion de lote clasificado ===")
 
-        # Arrange: Crear lote clasificado
-        logger.info("ARRANGE: Creando lote ya clasificado (estado CLASSIFIED)")
-        classified_lot = CoffeeLot(
-            lot_number="LOT-2024-0002",
-            producer_id=1,
-            harvest_date=date(2024, 5, 15),
-            coffee_variety=CoffeeVariety.CATURRA,
-            quantity=400.0,
-            processing_method=ProcessingMethod.NATURAL,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        classified_lot.id = 2
-        classified_lot.status = LotStatus.CLASSIFIED
-        logger.info(f"Lote clasificado: ID={classified_lot.id}, estado={classified_lot.status.value}")
-
-        mock_coffee_lot_repository.find_by_id.return_value = classified_lot
+        # Arrange: Lote clasificado precargado en el repositorio (wired_repo)
+        logger.info("Lote clasificado: ID=%s, estado=%s", wired_repo.id, wired_repo.status.value)
 
         command = UpdateCoffeeLotCommand(
             lot_id=2,
@@ -124,62 +174,9 @@ class TestUS07EdicionInformacionLote:
         with pytest.raises(Exception) as exc_info:
             coffee_lot_command_service.handle_update_coffee_lot(command)
 
-        logger.info(f"Excepcion capturada: {type(exc_info.value).__name__}")
-        logger.info(f"Mensaje de error: {str(exc_info.value)}")
+        logger.info("Excepcion capturada: %s", type(exc_info.value).__name__)
+        logger.info("Mensaje de error: %s", exc_info.value)
 
         assert "classification" in str(exc_info.value).lower(), \
             "El error debe indicar que no se puede editar después de clasificar"
         logger.info("OK: Proteccion de lotes clasificados funcionando correctamente")
-
-    def test_actualizar_metodo_procesamiento(
-            self,
-            coffee_lot_command_service,
-            mock_coffee_lot_repository
-    ):
-        """
-        Verifica que se pueda actualizar el método de procesamiento.
-
-        GIVEN un lote con método de procesamiento inicial
-        WHEN se actualiza el método
-        THEN debe cambiar correctamente
-        """
-        logger.info("=== TEST: Actualizar metodo de procesamiento ===")
-
-        # Arrange: Crear lote con procesamiento WASHED
-        logger.info("ARRANGE: Creando lote con procesamiento WASHED")
-        existing_lot = CoffeeLot(
-            lot_number="LOT-2024-0003",
-            producer_id=1,
-            harvest_date=date(2024, 5, 15),
-            coffee_variety=CoffeeVariety.BOURBON,
-            quantity=350.0,
-            processing_method=ProcessingMethod.WASHED,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        existing_lot.id = 3
-        logger.info(f"Metodo original: {existing_lot.processing_method.value}")
-
-        mock_coffee_lot_repository.find_by_id.return_value = existing_lot
-        mock_coffee_lot_repository.save.return_value = existing_lot
-
-        command = UpdateCoffeeLotCommand(
-            lot_id=3,
-            processing_method="HONEY"
-        )
-        logger.info(f"Nuevo metodo a aplicar: {command.processing_method}")
-
-        # Act: Actualizar método
-        logger.info("ACT: Actualizando metodo de procesamiento")
-        updated_lot = coffee_lot_command_service.handle_update_coffee_lot(command)
-        logger.info(f"Metodo actualizado: {updated_lot.processing_method.value}")
-
-        # Assert: Verificar actualización
-        logger.info("ASSERT: Verificando cambio de metodo")
-        assert updated_lot.processing_method == ProcessingMethod.HONEY, \
-            "El método de procesamiento debe haberse actualizado"
-        logger.info("OK: Metodo de procesamiento actualizado correctamente")
-
-        assert updated_lot.coffee_variety == CoffeeVariety.BOURBON, \
-            "Otros campos no deben cambiar"
-        logger.info("OK: Otros campos preservados correctamente")
\ No newline at end of file
@@ -16,17 +16,33 @@ import pytest
 import logging
 from datetime import date
 from coffee_lot_management.domain.model.aggregates.coffee_lot import (
-    CoffeeLot, LotStatus, CoffeeVariety, ProcessingMethod
+    LotStatus, CoffeeVariety, ProcessingMethod
 )
 from coffee_lot_management.domain.model.queries.get_coffee_lots_by_producer_query import (
     GetCoffeeLotsByProducerQuery
 )
 
+pytestmark = [pytest.mark.us08, pytest.mark.integration]
+
 logger = logging.getLogger(__name__)
 
+# Miembros de enum usados por los lotes de prueba
+_TYPICA = CoffeeVariety.TYPICA
+_CATURRA = CoffeeVariety.CATURRA
+_BOURBON = CoffeeVariety.BOURBON
+_WASHED = ProcessingMethod.WASHED
+_NATURAL = ProcessingMethod.NATURAL
+_HONEY = ProcessingMethod.HONEY
+_REGISTERED = LotStatus.REGISTERED
+_CLASSIFIED = LotStatus.CLASSIFIED
+
+# Fechas de cosecha reutilizadas por los lotes de prueba
+_HARVEST_2023_05_15 = date(2023, 5, 15)
+_HARVEST_2024_05_15 = date(2024, 5, 15)
+_HARVEST_2024_06_10 = date(2024, 6, 10)
+_HARVEST_2024_07_05 = date(2024, 7, 5)
+
 
-@pytest.mark.us08
-@pytest.mark.integration
 class TestUS08VisualizacionLotesProductor:
     """
     Suite de tests de integración para visualización de lotes por productor.
@@ -35,7 +51,8 @@ class TestUS08VisualizacionLotesProductor:
     def test_listar_todos_lotes_productor(
             self,
             coffee_lot_query_service,
-            mock_coffee_lot_repository
+            mock_coffee_lot_repository,
+            coffee_lot_factory
     ):
         """
         Verifica que un productor pueda ver todos sus lotes registrados.
@@ -49,44 +66,38 @@ class TestUS08VisualizacionLotesProductor:
         # Arrange: Crear lotes del productor
         logger.info("ARRANGE: Creando lotes de prueba para productor ID=1")
         producer_lots = [
-            CoffeeLot(
+            coffee_lot_factory(
+                id=1,
                 lot_number="LOT-2024-0001",
                 producer_id=1,
-                harvest_date=date(2024, 5, 15),
-                coffee_variety=CoffeeVariety.TYPICA,
+                harvest_date=_HARVEST_2024_05_15,
+                coffee_variety=_TYPICA,
                 quantity=500.0,
-                processing_method=ProcessingMethod.WASHED,
-                latitude=-12.0464,
-                longitude=-77.0428
+                processing_method=_WASHED
             ),
-            CoffeeLot(
+            coffee_lot_factory(
+                id=2,
                 lot_number="LOT-2024-0002",
                 producer_id=1,
-                harvest_date=date(2024, 6, 10),
-                coffee_variety=CoffeeVariety.CATURRA,
+                harvest_date=_HARVEST_2024_06_10,
+                coffee_variety=_CATURRA,
                 quantity=300.0,
-                processing_method=ProcessingMethod.NATURAL,
-                latitude=-12.0464,
-                longitude=-77.0428
+                processing_method=_NATURAL
             ),
-            CoffeeLot(
+            coffee_lot_factory(
+                id=3,
                 lot_number="LOT-2024-0003",
                 producer_id=1,
-                harvest_date=date(2024, 7, 5),
-                coffee_variety=CoffeeVariety.BOURBON,
+                harvest_date=_HARVEST_2024_07_05,
+                coffee_variety=_BOURBON,
                 quantity=450.0,
-                processing_method=ProcessingMethod.HONEY,
-                latitude=-12.0464,
-                longitude=-77.0428
+                processing_method=_HONEY
             )
         ]
 
-        for i, lot in enumerate(producer_lots):
-            lot.id = i + 1
-
-        logger.info(f"Creados {len(producer_lots)} lotes de prueba")
+        logger.info("Creados %s lotes de prueba", len(producer_lots))
         for lot in producer_lots:
-            logger.info(f"  - {lot.lot_number}: {lot.quantity}kg, {lot.coffee_variety.value}")
+            logger.info("  - %s: %skg, %s", lot.lot_number, lot.quantity, lot.coffee_variety.value)
 
         mock_coffee_lot_repository.find_by_producer_id.return_value = producer_lots
 
@@ -95,14 +106,14 @@ class TestUS08VisualizacionLotesProductor:
         # Act: Consultar lotes
         logger.info("ACT: Consultando lotes del productor")
         lots = coffee_lot_query_service.handle_get_coffee_lots_by_producer(query)
-        logger.info(f"Lotes recuperados: {len(lots)}")
+        logger.info("Lotes recuperados: %s", len(lots))
 
         # Assert: Verificar resultados
         logger.info("ASSERT: Verificando que se recuperaron todos los lotes")
         assert len(lots) == 3, "Debe retornar todos los lotes del productor"
         logger.info("OK: Cantidad correcta de lotes recuperados")
 
-        assert all(lot.producer_id == 1 for lot in lots), \
+        assert {lot.producer_id for lot in lots} == {1}, \
             "Todos los lotes deben pertenecer al productor"
         logger.info("OK: Todos los lotes pertenecen al productor correcto")
 
@@ -112,134 +123,67 @@ class TestUS08VisualizacionLotesProductor:
         assert "LOT-2024-0003" in lot_numbers, "Debe incluir el tercer lote"
         logger.info("OK: Todos los lotes esperados estan presentes")
 
-    def test_filtrar_lotes_por_estado(
+    @pytest.mark.parametrize("filter_kwargs,excluded_overrides,attr,expected", [
+        # Lote excluido: mismo año de cosecha, distinto estado
+        ({"status": "REGISTERED"}, {"status": _CLASSIFIED}, "status", _REGISTERED),
+        # Lote excluido: mismo estado, distinto año de cosecha
+        ({"harvest_year": 2024}, {"harvest_date": _HARVEST_2023_05_15}, "harvest_date.year", 2024),
+    ], ids=["status", "harvest_year"])
+    def test_filtrar_lotes(
             self,
+            filter_kwargs,
+            excluded_overrides,
+            attr,
+            expected,
             coffee_lot_query_service,
-            mock_coffee_lot_repository
+            mock_coffee_lot_repository,
+            coffee_lot_factory
     ):
         """
-        Verifica que se puedan filtrar lotes por estado.
+        Verifica que se puedan filtrar los lotes del productor por estado o por año de cosecha.
 
-        GIVEN un productor con lotes en diferentes estados
-        WHEN filtra por estado específico
-        THEN debe recibir solo lotes en ese estado
+        GIVEN un productor con dos lotes que solo difieren en el criterio filtrado
+        WHEN filtra por ese criterio
+        THEN debe recibir solo el lote que lo cumple
         """
-        logger.info("=== TEST: Filtrar lotes por estado ===")
+        logger.info("=== TEST: Filtrar lotes por %s ===", filter_kwargs)
 
-        # Arrange: Crear lotes con diferentes estados
-        logger.info("ARRANGE: Creando lotes con diferentes estados")
-        lot1 = CoffeeLot(
-            lot_number="LOT-2024-0001",
+        # Arrange: Crear lotes que solo difieren en el atributo filtrado
+        logger.info("ARRANGE: Creando lotes que difieren solo en %s", attr)
+        lot_fields = dict(
             producer_id=1,
-            harvest_date=date(2024, 5, 15),
-            coffee_variety=CoffeeVariety.TYPICA,
+            harvest_date=_HARVEST_2024_05_15,
+            coffee_variety=_TYPICA,
             quantity=500.0,
-            processing_method=ProcessingMethod.WASHED,
-            latitude=-12.0464,
-            longitude=-77.0428
+            processing_method=_WASHED,
+            status=_REGISTERED
         )
-        lot1.id = 1
-        lot1.status = LotStatus.REGISTERED
-
-        lot2 = CoffeeLot(
-            lot_number="LOT-2024-0002",
-            producer_id=1,
-            harvest_date=date(2024, 6, 10),
-            coffee_variety=CoffeeVariety.CATURRA,
-            quantity=300.0,
-            processing_method=ProcessingMethod.NATURAL,
-            latitude=-12.0464,
-            longitude=-77.0428
+        included_lot = coffee_lot_factory(id=1, lot_number="LOT-2024-0001", **lot_fields)
+        excluded_lot = coffee_lot_factory(
+            id=2, lot_number="LOT-2024-0002", **{**lot_fields, **excluded_overrides}
         )
-        lot2.id = 2
-        lot2.status = LotStatus.CLASSIFIED
 
-        logger.info(f"Lote 1: {lot1.lot_number}, estado={lot1.status.value}")
-        logger.info(f"Lote 2: {lot2.lot_number}, estado={lot2.status.value}")
+        logger.info("Lote 1: %s, estado=%s, fecha=%s", included_lot.lot_number, included_lot.status.value, included_lot.harvest_date)
+        logger.info("Lote 2: %s, estado=%s, fecha=%s", excluded_lot.lot_number, excluded_lot.status.value, excluded_lot.harvest_date)
 
-        mock_coffee_lot_repository.find_by_producer_id.return_value = [lot1, lot2]
+        mock_coffee_lot_repository.find_by_producer_id.return_value = [included_lot, excluded_lot]
 
-        query = GetCoffeeLotsByProducerQuery(
-            producer_id=1,
-            status="REGISTERED"
-        )
-        logger.info(f"Filtrando por estado: {query.status}")
+        query = GetCoffeeLotsByProducerQuery(producer_id=1, **filter_kwargs)
+        logger.info("Filtrando por: %s", filter_kwargs)
 
         # Act: Consultar lotes filtrados
-        logger.info("ACT: Consultando lotes filtrados por estado")
+        logger.info("ACT: Consultando lotes filtrados")
         lots = coffee_lot_query_service.handle_get_coffee_lots_by_producer(query)
-        logger.info(f"Lotes recuperados: {len(lots)}")
+        logger.info("Lotes recuperados: %s", len(lots))
 
         # Assert: Verificar filtrado
-        logger.info("ASSERT: Verificando filtrado por estado")
-        assert len(lots) == 1, "Debe retornar solo lotes en estado REGISTERED"
+        logger.info("ASSERT: Verificando filtrado")
+        assert len(lots) == 1, "Debe retornar solo los lotes que cumplen el filtro"
+        assert lots[0] is included_lot, "Debe retornar el lote que cumple el filtro"
         logger.info("OK: Cantidad correcta de lotes filtrados")
 
-        assert lots[0].status == LotStatus.REGISTERED, \
-            "El lote debe estar en estado REGISTERED"
-        logger.info(f"OK: Lote filtrado correcto: {lots[0].lot_number}, estado={lots[0].status.value}")
-
-    def test_filtrar_lotes_por_anio_cosecha(
-            self,
-            coffee_lot_query_service,
-            mock_coffee_lot_repository
-    ):
-        """
-        Verifica que se puedan filtrar lotes por año de cosecha.
-
-        GIVEN un productor con lotes de diferentes años
-        WHEN filtra por año específico
-        THEN debe recibir solo lotes de ese año
-        """
-        logger.info("=== TEST: Filtrar lotes por anio de cosecha ===")
-
-        # Arrange: Crear lotes de diferentes años
-        logger.info("ARRANGE: Creando lotes de diferentes anios")
-        lot_2023 = CoffeeLot(
-            lot_number="LOT-2023-0001",
-            producer_id=1,
-            harvest_date=date(2023, 5, 15),
-            coffee_variety=CoffeeVariety.TYPICA,
-            quantity=500.0,
-            processing_method=ProcessingMethod.WASHED,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot_2023.id = 1
-
-        lot_2024 = CoffeeLot(
-            lot_number="LOT-2024-0001",
-            producer_id=1,
-            harvest_date=date(2024, 6, 10),
-            coffee_variety=CoffeeVariety.CATURRA,
-            quantity=300.0,
-            processing_method=ProcessingMethod.NATURAL,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot_2024.id = 2
-
-        logger.info(f"Lote 2023: {lot_2023.lot_number}, fecha={lot_2023.harvest_date}")
-        logger.info(f"Lote 2024: {lot_2024.lot_number}, fecha={lot_2024.harvest_date}")
-
-        mock_coffee_lot_repository.find_by_producer_id.return_value = [lot_2023, lot_2024]
-
-        query = GetCoffeeLotsByProducerQuery(
-            producer_id=1,
-            harvest_year=2024
-        )
-        logger.info(f"Filtrando por anio: {query.harvest_year}")
-
-        # Act: Consultar lotes filtrados
-        logger.info("ACT: Consultando lotes del anio 2024")
-        lots = coffee_lot_query_service.handle_get_coffee_lots_by_producer(query)
-        logger.info(f"Lotes recuperados: {len(lots)}")
-
-        # Assert: Verificar filtrado
-        logger.info("ASSERT: Verificando filtrado por anio")
-        assert len(lots) == 1, "Debe retornar solo lotes del año 2024"
-        logger.info("OK: Cantidad correcta de lotes del anio 2024")
-
-        assert lots[0].harvest_date.year == 2024, \
-            "El lote debe ser del año 2024"
-        logger.info(f"OK: Lote filtrado correcto: {lots[0].lot_number}, anio={lots[0].harvest_date.year}")
\ No newline at end of file
+        value = lots[0]
+        for part in attr.split('.'):
+            value = getattr(value, part)
+        assert value == expected, f"El lote debe tener {attr}={expected}"
+        logger.info("OK: Lote filtrado correcto: %s, %s=%s", lots[0].lot_number, attr, value)
@@ -14,17 +14,55 @@ Ejecutar un test específico:
 
 import pytest
 import logging
+from collections import defaultdict
 from datetime import date
 from coffee_lot_management.domain.model.aggregates.coffee_lot import (
-    CoffeeLot, LotStatus, CoffeeVariety, ProcessingMethod
+    LotStatus, CoffeeVariety, ProcessingMethod
 )
 from coffee_lot_management.domain.model.queries.search_coffee_lots_query import SearchCoffeeLotsQuery
 
+pytestmark = [pytest.mark.us09, pytest.mark.integration]
+
 logger = logging.getLogger(__name__)
 
+# Miembros de enum usados por los lotes de prueba
+_TYPICA = CoffeeVariety.TYPICA
+_CATURRA = CoffeeVariety.CATURRA
+_BOURBON = CoffeeVariety.BOURBON
+_WASHED = ProcessingMethod.WASHED
+_NATURAL = ProcessingMethod.NATURAL
+_HONEY = ProcessingMethod.HONEY
+
+# Fechas de cosecha reutilizadas por los lotes de prueba
+_HARVEST_2024_05_15 = date(2024, 5, 15)
+_HARVEST_2024_05_20 = date(2024, 5, 20)
+_HARVEST_2024_06_10 = date(2024, 6, 10)
+
+# Lotes de la cooperativa: (id, producer_id, lot_number, variedad, cantidad, procesamiento, cosecha)
+_LOT_SPECS = [
+    (1, 1, "LOT-2024-0001", _TYPICA, 500.0, _WASHED, _HARVEST_2024_05_15),
+    (2, 1, "LOT-2024-0002", _CATURRA, 300.0, _NATURAL, _HARVEST_2024_06_10),
+    (3, 2, "LOT-2024-0003", _BOURBON, 400.0, _HONEY, _HARVEST_2024_05_20),
+]
+
+
+@pytest.fixture(scope="class")
+def coop_lots(coffee_lot_factory):
+    """Lotes de la cooperativa, construidos una sola vez para toda la clase."""
+    return [
+        coffee_lot_factory(
+            id=lot_id,
+            lot_number=lot_number,
+            producer_id=producer_id,
+            harvest_date=harvest_date,
+            coffee_variety=variety,
+            quantity=quantity,
+            processing_method=method
+        )
+        for lot_id, producer_id, lot_number, variety, quantity, method, harvest_date in _LOT_SPECS
+    ]
+
 
-@pytest.mark.us09
-@pytest.mark.integration
 class TestUS09VisualizacionLotesCooperativa:
     """
     Suite de tests de integración para visualización de lotes por cooperativa.
@@ -33,7 +71,9 @@ class TestUS09VisualizacionLotesCooperativa:
     def test_agrupar_lotes_por_productor(
             self,
             coffee_lot_query_service,
-            mock_db_session
+            mock_db_session,
+            stub_query,
+            coop_lots
     ):
         """
         Verifica que una cooperativa pueda ver lotes agrupados por productor.
@@ -47,53 +87,13 @@ class TestUS09VisualizacionLotesCooperativa:
         # Arrange: Crear lotes de múltiples productores
         logger.info("ARRANGE: Creando lotes de 3 productores diferentes")
 
-        # Productor 1 - 2 lotes
-        lot1_p1 = CoffeeLot(
-            lot_number="LOT-2024-0001",
-            producer_id=1,
-            harvest_date=date(2024, 5, 15),
-            coffee_variety=CoffeeVariety.TYPICA,
-            quantity=500.0,
-            processing_method=ProcessingMethod.WASHED,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot1_p1.id = 1
-
-        lot2_p1 = CoffeeLot(
-            lot_number="LOT-2024-0002",
-            producer_id=1,
-            harvest_date=date(2024, 6, 10),
-            coffee_variety=CoffeeVariety.CATURRA,
-            quantity=300.0,
-            processing_method=ProcessingMethod.NATURAL,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot2_p1.id = 2
-
-        # Productor 2 - 1 lote
-        lot1_p2 = CoffeeLot(
-            lot_number="LOT-2024-0003",
-            producer_id=2,
-            harvest_date=date(2024, 5, 20),
-            coffee_variety=CoffeeVariety.BOURBON,
-            quantity=400.0,
-            processing_method=ProcessingMethod.HONEY,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot1_p2.id = 3
-
-        all_lots = [lot1_p1, lot2_p1, lot1_p2]
-        logger.info(f"Total de lotes creados: {len(all_lots)}")
-        logger.info(f"Productor 1: 2 lotes")
-        logger.info(f"Productor 2: 1 lote")
+        # Productor 1 - 2 lotes, Productor 2 - 1 lote
+        logger.info("Total de lotes creados: %s", len(coop_lots))
+        logger.info("Productor 1: 2 lotes")
+        logger.info("Productor 2: 1 lote")
 
         # Mock query result
-        mock_query = mock_db_session.query.return_value
-        mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = all_lots
+        mock_db_session.query.return_value = stub_query(coop_lots)
 
         # Act: Consultar todos los lotes y agrupar
         logger.info("ACT: Consultando y agrupando lotes por productor")
@@ -101,15 +101,13 @@ class TestUS09VisualizacionLotesCooperativa:
         lots = coffee_lot_query_service.handle_search_coffee_lots(query)
 
         # Agrupar por productor
-        grouped_lots = {}
+        grouped_lots = defaultdict(list)
         for lot in lots:
-            if lot.producer_id not in grouped_lots:
-                grouped_lots[lot.producer_id] = []
             grouped_lots[lot.producer_id].append(lot)
 
-        logger.info(f"Productores encontrados: {list(grouped_lots.keys())}")
+        logger.info("Productores encontrados: %s", list(grouped_lots.keys()))
         for producer_id, producer_lots in grouped_lots.items():
-            logger.info(f"  Productor {producer_id}: {len(producer_lots)} lotes")
+            logger.info("  Productor %s: %s lotes", producer_id, len(producer_lots))
 
         # Assert: Verificar agrupación
         logger.info("ASSERT: Verificando agrupacion correcta")
@@ -117,15 +115,17 @@ class TestUS09VisualizacionLotesCooperativa:
         logger.info("OK: Numero correcto de productores")
 
         assert len(grouped_lots[1]) == 2, "Productor 1 debe tener 2 lotes"
-        logger.info(f"OK: Productor 1 tiene {len(grouped_lots[1])} lotes")
+        logger.info("OK: Productor 1 tiene %s lotes", len(grouped_lots[1]))
 
         assert len(grouped_lots[2]) == 1, "Productor 2 debe tener 1 lote"
-        logger.info(f"OK: Productor 2 tiene {len(grouped_lots[2])} lote")
+        logger.info("OK: Productor 2 tiene %s lote", len(grouped_lots[2]))
 
     def test_visualizar_estadisticas_por_productor(
             self,
             coffee_lot_query_service,
-            mock_db_session
+            mock_db_session,
+            stub_query,
+            coop_lots
     ):
         """
         Verifica que se puedan calcular estadísticas por productor.
@@ -139,36 +139,10 @@ class TestUS09VisualizacionLotesCooperativa:
         # Arrange: Crear lotes con cantidades conocidas
         logger.info("ARRANGE: Creando lotes con cantidades especificas")
 
-        lot1_p1 = CoffeeLot(
-            lot_number="LOT-2024-0001",
-            producer_id=1,
-            harvest_date=date(2024, 5, 15),
-            coffee_variety=CoffeeVariety.TYPICA,
-            quantity=500.0,
-            processing_method=ProcessingMethod.WASHED,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot1_p1.id = 1
-
-        lot2_p1 = CoffeeLot(
-            lot_number="LOT-2024-0002",
-            producer_id=1,
-            harvest_date=date(2024, 6, 10),
-            coffee_variety=CoffeeVariety.CATURRA,
-            quantity=300.0,
-            processing_method=ProcessingMethod.NATURAL,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot2_p1.id = 2
-
-        all_lots = [lot1_p1, lot2_p1]
-        logger.info(f"Productor 1: Lote 1 = {lot1_p1.quantity}kg, Lote 2 = {lot2_p1.quantity}kg")
+        lot1_p1, lot2_p1 = coop_lots[:2]
+        logger.info("Productor 1: Lote 1 = %skg, Lote 2 = %skg", lot1_p1.quantity, lot2_p1.quantity)
 
-        mock_query = mock_db_session.query.return_value
-        mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = all_lots
+        mock_db_session.query.return_value = stub_query(coop_lots)
 
         # Act: Calcular estadísticas
         logger.info("ACT: Calculando estadisticas por productor")
@@ -176,19 +150,15 @@ class TestUS09VisualizacionLotesCooperativa:
         lots = coffee_lot_query_service.handle_search_coffee_lots(query)
 
         # Calcular total por productor
-        producer_stats = {}
+        producer_stats = defaultdict(lambda: {'total_lots': 0, 'total_quantity': 0.0})
         for lot in lots:
-            if lot.producer_id not in producer_stats:
-                producer_stats[lot.producer_id] = {
-                    'total_lots': 0,
-                    'total_quantity': 0.0
-                }
-            producer_stats[lot.producer_id]['total_lots'] += 1
-            producer_stats[lot.producer_id]['total_quantity'] += lot.quantity
-
-        logger.info(f"Estadisticas calculadas:")
+            stats = producer_stats[lot.producer_id]
+            stats['total_lots'] += 1
+            stats['total_quantity'] += lot.quantity
+
+        logger.info("Estadisticas calculadas:")
         for producer_id, stats in producer_stats.items():
-            logger.info(f"  Productor {producer_id}: {stats['total_lots']} lotes, {stats['total_quantity']}kg")
+            logger.info("  Productor %s: %s lotes, %skg", producer_id, stats['total_lots'], stats['total_quantity'])
 
         # Assert: Verificar estadísticas
         logger.info("ASSERT: Verificando estadisticas calculadas")
@@ -198,12 +168,14 @@ class TestUS09VisualizacionLotesCooperativa:
 
         assert producer_stats[1]['total_quantity'] == 800.0, \
             "Productor 1 debe tener 800kg totales"
-        logger.info(f"OK: Cantidad total correcta: {producer_stats[1]['total_quantity']}kg")
+        logger.info("OK: Cantidad total correcta: %skg", producer_stats[1]['total_quantity'])
 
     def test_filtrar_lotes_cooperativa_por_variedad(
             self,
             coffee_lot_query_service,
-            mock_db_session
+            mock_db_session,
+            stub_query,
+            coop_lots
     ):
         """
         Verifica que la cooperativa pueda filtrar lotes por variedad de café.
@@ -217,49 +189,25 @@ class TestUS09VisualizacionLotesCooperativa:
         # Arrange: Crear lotes de diferentes variedades
         logger.info("ARRANGE: Creando lotes de diferentes variedades")
 
-        lot_typica = CoffeeLot(
-            lot_number="LOT-2024-0001",
-            producer_id=1,
-            harvest_date=date(2024, 5, 15),
-            coffee_variety=CoffeeVariety.TYPICA,
-            quantity=500.0,
-            processing_method=ProcessingMethod.WASHED,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot_typica.id = 1
-
-        lot_caturra = CoffeeLot(
-            lot_number="LOT-2024-0002",
-            producer_id=2,
-            harvest_date=date(2024, 6, 10),
-            coffee_variety=CoffeeVariety.CATURRA,
-            quantity=300.0,
-            processing_method=ProcessingMethod.NATURAL,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot_caturra.id = 2
+        lot_typica, lot_caturra = coop_lots[:2]
 
-        logger.info(f"Lote 1: {lot_typica.lot_number}, variedad={lot_typica.coffee_variety.value}")
-        logger.info(f"Lote 2: {lot_caturra.lot_number}, variedad={lot_caturra.coffee_variety.value}")
+        logger.info("Lote 1: %s, variedad=%s", lot_typica.lot_number, lot_typica.coffee_variety.value)
+        logger.info("Lote 2: %s, variedad=%s", lot_caturra.lot_number, lot_caturra.coffee_variety.value)
 
         # Mock query para filtrar solo TYPICA
-        mock_query = mock_db_session.query.return_value
-        mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = [lot_typica]
+        mock_db_session.query.return_value = stub_query(coop_lots[:1])
 
         # Act: Filtrar por variedad
         logger.info("ACT: Filtrando lotes por variedad TYPICA")
         query = SearchCoffeeLotsQuery(variety="TYPICA")
         lots = coffee_lot_query_service.handle_search_coffee_lots(query)
-        logger.info(f"Lotes recuperados: {len(lots)}")
+        logger.info("Lotes recuperados: %s", len(lots))
 
         # Assert: Verificar filtrado
         logger.info("ASSERT: Verificando filtrado por variedad")
         assert len(lots) == 1, "Debe retornar solo lotes de variedad TYPICA"
         logger.info("OK: Cantidad correcta de lotes filtrados")
 
-        assert lots[0].coffee_variety == CoffeeVariety.TYPICA, \
+        assert lots[0].coffee_variety == _TYPICA, \
             "El lote debe ser de variedad TYPICA"
-        logger.info(f"OK: Variedad correcta: {lots[0].coffee_variety.value}")
\ No newline at end of file
+        logger.info("OK: Variedad correcta: %s", lots[0].coffee_variety.value)
\ No newline at end of file
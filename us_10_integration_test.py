@@ -9,19 +9,76 @@ Ejecutar todos los tests de esta US:
     pytest us_10_integration_test.py -v
 
 Ejecutar un test específico:
-    pytest us_10_integration_test.py::TestUS10BusquedaRapidaLotes::test_buscar_por_rango_fechas -v
+    pytest us_10_integration_test.py::TestUS10BusquedaRapidaLotes::test_buscar_lotes -v
 """
 
 import pytest
 import logging
 from datetime import date
 from coffee_lot_management.domain.model.aggregates.coffee_lot import (
-    CoffeeLot, LotStatus, CoffeeVariety, ProcessingMethod
+    LotStatus, CoffeeVariety, ProcessingMethod
 )
 from coffee_lot_management.domain.model.queries.search_coffee_lots_query import SearchCoffeeLotsQuery
 
 logger = logging.getLogger(__name__)
 
+# Miembros de enum usados por los lotes de prueba
+_TYPICA = CoffeeVariety.TYPICA
+_CATURRA = CoffeeVariety.CATURRA
+_BOURBON = CoffeeVariety.BOURBON
+_GEISHA = CoffeeVariety.GEISHA
+_WASHED = ProcessingMethod.WASHED
+_NATURAL = ProcessingMethod.NATURAL
+_HONEY = ProcessingMethod.HONEY
+_REGISTERED = LotStatus.REGISTERED
+
+# Fechas de cosecha reutilizadas por los lotes de prueba
+_HARVEST_2024_05_15 = date(2024, 5, 15)
+_HARVEST_2024_05_18 = date(2024, 5, 18)
+_HARVEST_2024_05_20 = date(2024, 5, 20)
+_HARVEST_2024_06_10 = date(2024, 6, 10)
+_HARVEST_2024_06_20 = date(2024, 6, 20)
+_HARVEST_2024_08_10 = date(2024, 8, 10)
+
+# Rango de búsqueda por fecha de cosecha
+_SEARCH_START = date(2024, 5, 1)
+_SEARCH_END = date(2024, 6, 30)
+
+
+# Lotes de búsqueda: nombre -> (id, lot_number, producer_id, cosecha, variedad, cantidad, procesamiento)
+_SEARCH_LOT_SPECS = {
+    # Rango de fechas
+    "may": (1, "LOT-2024-0001", 1, _HARVEST_2024_05_15, _TYPICA, 500.0, _WASHED),
+    "june": (2, "LOT-2024-0002", 1, _HARVEST_2024_06_20, _CATURRA, 300.0, _NATURAL),
+    "august": (3, "LOT-2024-0003", 1, _HARVEST_2024_08_10, _BOURBON, 400.0, _HONEY),
+    # Variedad
+    "typica1": (1, "LOT-2024-0001", 1, _HARVEST_2024_05_15, _TYPICA, 500.0, _WASHED),
+    "typica2": (2, "LOT-2024-0002", 2, _HARVEST_2024_06_10, _TYPICA, 300.0, _NATURAL),
+    "geisha": (3, "LOT-2024-0003", 1, _HARVEST_2024_05_20, _GEISHA, 200.0, _HONEY),
+    # Múltiples filtros: solo "match" es TYPICA + WASHED + REGISTERED
+    "match": (1, "LOT-2024-0001", 1, _HARVEST_2024_05_15, _TYPICA, 500.0, _WASHED),
+    "no_match_variety": (2, "LOT-2024-0002", 1, _HARVEST_2024_05_20, _CATURRA, 300.0, _WASHED),
+    "no_match_method": (3, "LOT-2024-0003", 1, _HARVEST_2024_05_18, _TYPICA, 400.0, _NATURAL),
+}
+
+
+@pytest.fixture(scope="module")
+def search_lots(coffee_lot_factory):
+    """Lotes de búsqueda por nombre, construidos una sola vez por módulo."""
+    return {
+        name: coffee_lot_factory(
+            id=lot_id,
+            lot_number=lot_number,
+            producer_id=producer_id,
+            harvest_date=harvest_date,
+            coffee_variety=variety,
+            quantity=quantity,
+            processing_method=method
+        )
+        for name, (lot_id, lot_number, producer_id, harvest_date, variety, quantity, method)
+        in _SEARCH_LOT_SPECS.items()
+    }
+
 
 @pytest.mark.us10
 @pytest.mark.integration
@@ -30,250 +87,102 @@ class TestUS10BusquedaRapidaLotes:
     Suite de tests de integración para búsqueda rápida de lotes.
     """
 
-    def test_buscar_por_rango_fechas(
+    @pytest.mark.parametrize("query_kwargs,returned,excluded,validator", [
+        (
+            {"start_date": _SEARCH_START, "end_date": _SEARCH_END, "limit": 50},
+            ["may", "june"],
+            ["august"],
+            lambda lot: _SEARCH_START <= lot.harvest_date <= _SEARCH_END
+        ),
+        (
+            {"variety": "TYPICA"},
+            ["typica1", "typica2"],
+            ["geisha"],
+            lambda lot: lot.coffee_variety == _TYPICA
+        ),
+        (
+            {"variety": "TYPICA", "processing_method": "WASHED", "status": "REGISTERED"},
+            ["match"],
+            ["no_match_variety", "no_match_method"],
+            lambda lot: (lot.coffee_variety, lot.processing_method, lot.status) == (_TYPICA, _WASHED, _REGISTERED)
+        ),
+    ], ids=["rango_fechas", "variedad", "multiples_filtros"])
+    def test_buscar_lotes(
             self,
+            query_kwargs,
+            returned,
+            excluded,
+            validator,
             coffee_lot_query_service,
-            mock_db_session
+            mock_db_session,
+            build_query_mock,
+            search_lots
     ):
         """
-        Verifica que se puedan buscar lotes por rango de fechas de cosecha.
+        Verifica que se puedan buscar lotes por fecha, variedad o varios criterios combinados.
 
-        GIVEN lotes con diferentes fechas de cosecha
-        WHEN se busca por rango de fechas
-        THEN debe retornar solo lotes en ese rango
+        GIVEN lotes con diferentes fechas, variedades y procesamientos
+        WHEN se busca con uno o varios filtros
+        THEN debe retornar solo lotes que cumplan todos los criterios
         """
-        logger.info("=== TEST: Buscar lotes por rango de fechas ===")
-
-        # Arrange: Crear lotes con diferentes fechas
-        logger.info("ARRANGE: Creando lotes con diferentes fechas de cosecha")
+        logger.info("=== TEST: Buscar lotes con filtros %s ===", query_kwargs)
 
-        lot_may = CoffeeLot(
-            lot_number="LOT-2024-0001",
-            producer_id=1,
-            harvest_date=date(2024, 5, 15),
-            coffee_variety=CoffeeVariety.TYPICA,
-            quantity=500.0,
-            processing_method=ProcessingMethod.WASHED,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot_may.id = 1
-
-        lot_june = CoffeeLot(
-            lot_number="LOT-2024-0002",
-            producer_id=1,
-            harvest_date=date(2024, 6, 20),
-            coffee_variety=CoffeeVariety.CATURRA,
-            quantity=300.0,
-            processing_method=ProcessingMethod.NATURAL,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot_june.id = 2
+        # Mock query para retornar solo los lotes que cumplen los filtros
+        expected_lots = [search_lots[name] for name in returned]
+        mock_query = build_query_mock(expected_lots)
+        mock_db_session.query.return_value = mock_query
 
-        lot_august = CoffeeLot(
-            lot_number="LOT-2024-0003",
-            producer_id=1,
-            harvest_date=date(2024, 8, 10),
-            coffee_variety=CoffeeVariety.BOURBON,
-            quantity=400.0,
-            processing_method=ProcessingMethod.HONEY,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot_august.id = 3
-
-        logger.info(f"Lote 1: {lot_may.harvest_date}")
-        logger.info(f"Lote 2: {lot_june.harvest_date}")
-        logger.info(f"Lote 3: {lot_august.harvest_date}")
-
-        # Mock query para retornar lotes en rango mayo-junio
-        mock_query = mock_db_session.query.return_value
-        mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = [lot_may, lot_june]
-
-        # Act: Buscar por rango de fechas
-        logger.info("ACT: Buscando lotes entre 2024-05-01 y 2024-06-30")
-        query = SearchCoffeeLotsQuery(
-            start_date=date(2024, 5, 1),
-            end_date=date(2024, 6, 30)
-        )
+        # Act: Buscar con los filtros del caso
+        logger.info("ACT: Buscando lotes")
+        query = SearchCoffeeLotsQuery(**query_kwargs)
         lots = coffee_lot_query_service.handle_search_coffee_lots(query)
-        logger.info(f"Lotes encontrados: {len(lots)}")
+        logger.info("Lotes encontrados: %s", len(lots))
 
         # Assert: Verificar resultados
-        logger.info("ASSERT: Verificando busqueda por rango de fechas")
-        assert len(lots) == 2, "Debe retornar solo lotes en el rango de fechas"
-        logger.info("OK: Cantidad correcta de lotes en el rango")
-
-        for lot in lots:
-            logger.info(f"  Verificando lote: {lot.lot_number}, fecha={lot.harvest_date}")
-            assert date(2024, 5, 1) <= lot.harvest_date <= date(2024, 6, 30), \
-                "Todos los lotes deben estar en el rango"
-        logger.info("OK: Todos los lotes estan dentro del rango especificado")
-
-    def test_buscar_por_variedad_cafe(
-            self,
-            coffee_lot_query_service,
-            mock_db_session
-    ):
-        """
-        Verifica que se puedan buscar lotes por variedad de café.
-
-        GIVEN lotes de diferentes variedades
-        WHEN se busca por variedad específica
-        THEN debe retornar solo lotes de esa variedad
-        """
-        logger.info("=== TEST: Buscar lotes por variedad de cafe ===")
-
-        # Arrange: Crear lotes de diferentes variedades
-        logger.info("ARRANGE: Creando lotes de variedades TYPICA y GEISHA")
-
-        lot_typica1 = CoffeeLot(
-            lot_number="LOT-2024-0001",
-            producer_id=1,
-            harvest_date=date(2024, 5, 15),
-            coffee_variety=CoffeeVariety.TYPICA,
-            quantity=500.0,
-            processing_method=ProcessingMethod.WASHED,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot_typica1.id = 1
+        logger.info("ASSERT: Verificando resultados de la busqueda")
+        assert len(lots) == len(expected_lots)
+        logger.info("OK: Cantidad correcta de lotes encontrados")
 
-        lot_typica2 = CoffeeLot(
-            lot_number="LOT-2024-0002",
-            producer_id=2,
-            harvest_date=date(2024, 6, 10),
-            coffee_variety=CoffeeVariety.TYPICA,
-            quantity=300.0,
-            processing_method=ProcessingMethod.NATURAL,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot_typica2.id = 2
-
-        lot_geisha = CoffeeLot(
-            lot_number="LOT-2024-0003",
-            producer_id=1,
-            harvest_date=date(2024, 5, 20),
-            coffee_variety=CoffeeVariety.GEISHA,
-            quantity=200.0,
-            processing_method=ProcessingMethod.HONEY,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot_geisha.id = 3
-
-        logger.info(f"Lote 1: {lot_typica1.lot_number}, variedad={lot_typica1.coffee_variety.value}")
-        logger.info(f"Lote 2: {lot_typica2.lot_number}, variedad={lot_typica2.coffee_variety.value}")
-        logger.info(f"Lote 3: {lot_geisha.lot_number}, variedad={lot_geisha.coffee_variety.value}")
-
-        # Mock query para retornar solo TYPICA
-        mock_query = mock_db_session.query.return_value
-        mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = [lot_typica1, lot_typica2]
-
-        # Act: Buscar por variedad
-        logger.info("ACT: Buscando lotes de variedad TYPICA")
-        query = SearchCoffeeLotsQuery(variety="TYPICA")
-        lots = coffee_lot_query_service.handle_search_coffee_lots(query)
-        logger.info(f"Lotes encontrados: {len(lots)}")
-
-        # Assert: Verificar resultados
-        logger.info("ASSERT: Verificando busqueda por variedad")
-        assert len(lots) == 2, "Debe retornar solo lotes de variedad TYPICA"
-        logger.info("OK: Cantidad correcta de lotes TYPICA")
+        mock_query.limit.assert_called_once_with(query.limit)
+        logger.info("OK: Busqueda paginada con limit=%s", query.limit)
 
         for lot in lots:
-            logger.info(f"  Verificando lote: {lot.lot_number}, variedad={lot.coffee_variety.value}")
-            assert lot.coffee_variety == CoffeeVariety.TYPICA, \
-                "Todos los lotes deben ser de variedad TYPICA"
-        logger.info("OK: Todos los lotes son de la variedad correcta")
+            assert validator(lot), f"El lote {lot.lot_number} debe cumplir los filtros"
+        logger.info("OK: %s lotes cumplen los criterios de busqueda", len(lots))
+
+        # Los lotes fuera del filtro deben ser rechazados por el mismo criterio
+        for name in excluded:
+            assert not validator(search_lots[name]), f"El lote '{name}' no debe cumplir los filtros"
+        logger.info("OK: %s lotes fuera de los criterios rechazados", len(excluded))
 
-    def test_buscar_con_multiples_filtros(
+    def test_rango_fechas_usa_between(
             self,
             coffee_lot_query_service,
-            mock_db_session
+            mock_db_session,
+            build_query_mock
     ):
         """
-        Verifica que se puedan combinar múltiples criterios de búsqueda.
+        Verifica que el rango de fechas se traduzca a un BETWEEN directo sobre harvest_date.
 
-        GIVEN lotes con diferentes características
-        WHEN se busca con múltiples filtros
-        THEN debe retornar solo lotes que cumplan todos los criterios
+        GIVEN una búsqueda con fecha de inicio y fin
+        WHEN se construye la consulta SQL
+        THEN debe filtrar con BETWEEN sin envolver la columna en CAST (para usar el índice)
         """
-        logger.info("=== TEST: Buscar con multiples filtros combinados ===")
-
-        # Arrange: Crear lotes variados
-        logger.info("ARRANGE: Creando lotes con diferentes caracteristicas")
+        logger.info("=== TEST: Rango de fechas usa BETWEEN ===")
 
-        lot_match = CoffeeLot(
-            lot_number="LOT-2024-0001",
-            producer_id=1,
-            harvest_date=date(2024, 5, 15),
-            coffee_variety=CoffeeVariety.TYPICA,
-            quantity=500.0,
-            processing_method=ProcessingMethod.WASHED,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot_match.id = 1
-        lot_match.status = LotStatus.REGISTERED
+        mock_query = build_query_mock([])
+        mock_db_session.query.return_value = mock_query
 
-        lot_no_match1 = CoffeeLot(
-            lot_number="LOT-2024-0002",
-            producer_id=1,
-            harvest_date=date(2024, 5, 20),
-            coffee_variety=CoffeeVariety.CATURRA,  # Variedad diferente
-            quantity=300.0,
-            processing_method=ProcessingMethod.WASHED,
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot_no_match1.id = 2
-        lot_no_match1.status = LotStatus.REGISTERED
-
-        lot_no_match2 = CoffeeLot(
-            lot_number="LOT-2024-0003",
-            producer_id=1,
-            harvest_date=date(2024, 5, 18),
-            coffee_variety=CoffeeVariety.TYPICA,
-            quantity=400.0,
-            processing_method=ProcessingMethod.NATURAL,  # Procesamiento diferente
-            latitude=-12.0464,
-            longitude=-77.0428
-        )
-        lot_no_match2.id = 3
-        lot_no_match2.status = LotStatus.REGISTERED
-
-        logger.info(f"Lote 1: TYPICA + WASHED + REGISTERED (debe coincidir)")
-        logger.info(f"Lote 2: CATURRA + WASHED + REGISTERED (no coincide - variedad)")
-        logger.info(f"Lote 3: TYPICA + NATURAL + REGISTERED (no coincide - procesamiento)")
-
-        # Mock query para retornar solo el que coincide
-        mock_query = mock_db_session.query.return_value
-        mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = [lot_match]
-
-        # Act: Buscar con múltiples filtros
-        logger.info("ACT: Buscando con filtros: TYPICA + WASHED + REGISTERED")
-        query = SearchCoffeeLotsQuery(
-            variety="TYPICA",
-            processing_method="WASHED",
-            status="REGISTERED"
-        )
-        lots = coffee_lot_query_service.handle_search_coffee_lots(query)
-        logger.info(f"Lotes encontrados: {len(lots)}")
-
-        # Assert: Verificar resultados
-        logger.info("ASSERT: Verificando busqueda con multiples filtros")
-        assert len(lots) == 1, "Debe retornar solo lotes que cumplan todos los criterios"
-        logger.info("OK: Solo 1 lote cumple todos los criterios")
-
-        lot = lots[0]
-        logger.info(f"Lote encontrado: {lot.lot_number}")
-        assert lot.coffee_variety == CoffeeVariety.TYPICA, "Debe ser variedad TYPICA"
-        assert lot.processing_method == ProcessingMethod.WASHED, "Debe ser procesamiento WASHED"
-        assert lot.status == LotStatus.REGISTERED, "Debe estar en estado REGISTERED"
-        logger.info("OK: El lote cumple todos los criterios de busqueda")
\ No newline at end of file
+        # Act: Buscar por rango de fechas
+        logger.info("ACT: Buscando lotes entre %s y %s", _SEARCH_START, _SEARCH_END)
+        query = SearchCoffeeLotsQuery(start_date=_SEARCH_START, end_date=_SEARCH_END)
+        coffee_lot_query_service.handle_search_coffee_lots(query)
+
+        # Assert: Verificar SQL generado
+        (condition,) = mock_query.filter.call_args.args
+        sql = str(condition)
+        logger.info("Condicion SQL generada: %s", sql)
+
+        assert "coffee_lots.harvest_date BETWEEN" in sql
+        assert "CAST" not in sql.upper()
+        logger.info("OK: Rango de fechas compatible con el indice de harvest_date")
@@ -14,14 +14,31 @@ Ejecutar un test específico:
 
 import pytest
 import logging
+import re
 from datetime import date
+from fastapi import HTTPException, status
 from coffee_lot_management.domain.model.aggregates.coffee_lot import (
-    CoffeeLot, LotStatus, CoffeeVariety, ProcessingMethod
+    LotStatus, CoffeeVariety, ProcessingMethod
 )
 from coffee_lot_management.domain.model.commands.delete_coffee_lot_command import DeleteCoffeeLotCommand
 
 logger = logging.getLogger(__name__)
 
+# Mensajes de error esperados, compilados una sola vez
+_REGISTERED_RE = re.compile(r"REGISTERED")
+_NOT_FOUND_RE = re.compile(r"not found", re.IGNORECASE)
+
+# Miembros de enum usados por los lotes de prueba
+_TYPICA = CoffeeVariety.TYPICA
+_CATURRA = CoffeeVariety.CATURRA
+_WASHED = ProcessingMethod.WASHED
+_NATURAL = ProcessingMethod.NATURAL
+_REGISTERED = LotStatus.REGISTERED
+_CLASSIFIED = LotStatus.CLASSIFIED
+
+# Fechas de cosecha reutilizadas por los lotes de prueba
+_HARVEST_2024_05_15 = date(2024, 5, 15)
+
 
 @pytest.mark.us11
 @pytest.mark.integration
@@ -33,7 +50,8 @@ class TestUS11EliminacionLotes:
     def test_eliminar_lote_registrado(
             self,
             coffee_lot_command_service,
-            mock_coffee_lot_repository
+            mock_coffee_lot_repository,
+            coffee_lot_factory
     ):
         """
         Verifica que se pueda eliminar un lote en estado REGISTERED.
@@ -46,20 +64,18 @@ class TestUS11EliminacionLotes:
 
         # Arrange: Crear lote en estado REGISTERED
         logger.info("ARRANGE: Creando lote en estado REGISTERED para eliminacion")
-        coffee_lot = CoffeeLot(
+        coffee_lot = coffee_lot_factory(
+            id=1,
             lot_number="LOT-2024-0001",
             producer_id=1,
-            harvest_date=date(2024, 5, 15),
-            coffee_variety=CoffeeVariety.TYPICA,
+            harvest_date=_HARVEST_2024_05_15,
+            coffee_variety=_TYPICA,
             quantity=500.0,
-            processing_method=ProcessingMethod.WASHED,
-            latitude=-12.0464,
-            longitude=-77.0428
+            processing_method=_WASHED,
+            status=_REGISTERED
         )
-        coffee_lot.id = 1
-        coffee_lot.status = LotStatus.REGISTERED
-        logger.info(f"Lote creado: ID={coffee_lot.id}, numero={coffee_lot.lot_number}")
-        logger.info(f"Estado: {coffee_lot.status.value}")
+        logger.info("Lote creado: ID=%s, numero=%s", coffee_lot.id, coffee_lot.lot_number)
+        logger.info("Estado: %s", coffee_lot.status.value)
 
         mock_coffee_lot_repository.find_by_id.return_value = coffee_lot
         mock_coffee_lot_repository.delete.return_value = None
@@ -68,7 +84,7 @@ class TestUS11EliminacionLotes:
             lot_id=1,
             deletion_reason="Lote duplicado por error"
         )
-        logger.info(f"Razon de eliminacion: {command.deletion_reason}")
+        logger.info("Razon de eliminacion: %s", command.deletion_reason)
 
         # Act: Eliminar lote
         logger.info("ACT: Eliminando lote del sistema")
@@ -83,7 +99,8 @@ class TestUS11EliminacionLotes:
     def test_no_eliminar_lote_clasificado(
             self,
             coffee_lot_command_service,
-            mock_coffee_lot_repository
+            mock_coffee_lot_repository,
+            coffee_lot_factory
     ):
         """
         Verifica que no se pueda eliminar un lote ya clasificado.
@@ -96,19 +113,17 @@ class TestUS11EliminacionLotes:
 
         # Arrange: Crear lote clasificado
         logger.info("ARRANGE: Creando lote en estado CLASSIFIED")
-        coffee_lot = CoffeeLot(
+        coffee_lot = coffee_lot_factory(
+            id=2,
             lot_number="LOT-2024-0002",
             producer_id=1,
-            harvest_date=date(2024, 5, 15),
-            coffee_variety=CoffeeVariety.CATURRA,
+            harvest_date=_HARVEST_2024_05_15,
+            coffee_variety=_CATURRA,
             quantity=400.0,
-            processing_method=ProcessingMethod.NATURAL,
-            latitude=-12.0464,
-            longitude=-77.0428
+            processing_method=_NATURAL,
+            status=_CLASSIFIED
         )
-        coffee_lot.id = 2
-        coffee_lot.status = LotStatus.CLASSIFIED
-        logger.info(f"Lote creado: ID={coffee_lot.id}, estado={coffee_lot.status.value}")
+        logger.info("Lote creado: ID=%s, estado=%s", coffee_lot.id, coffee_lot.status.value)
         logger.info("Este lote NO deberia poder eliminarse")
 
         mock_coffee_lot_repository.find_by_id.return_value = coffee_lot
@@ -120,14 +135,13 @@ class TestUS11EliminacionLotes:
 
         # Act & Assert: Intentar eliminación y verificar error
         logger.info("ACT & ASSERT: Intentando eliminar lote clasificado")
-        with pytest.raises(Exception) as exc_info:
+        # El mensaje debe indicar que solo se pueden eliminar lotes en estado REGISTERED
+        with pytest.raises(HTTPException, match=_REGISTERED_RE) as exc_info:
             coffee_lot_command_service.handle_delete_coffee_lot(command)
 
-        logger.info(f"Excepcion capturada: {type(exc_info.value).__name__}")
-        logger.info(f"Mensaje de error: {str(exc_info.value)}")
+        logger.info("Mensaje de error: %s", exc_info.value)
 
-        assert "REGISTERED" in str(exc_info.value), \
-            "El error debe indicar que solo se pueden eliminar lotes en estado REGISTERED"
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
         logger.info("OK: Proteccion de lotes clasificados funcionando correctamente")
 
     def test_verificar_existencia_antes_eliminar(
@@ -156,12 +170,11 @@ class TestUS11EliminacionLotes:
 
         # Act & Assert: Intentar eliminación y verificar error
         logger.info("ACT & ASSERT: Intentando eliminar lote inexistente")
-        with pytest.raises(Exception) as exc_info:
+        # El mensaje debe indicar que el lote no fue encontrado
+        with pytest.raises(HTTPException, match=_NOT_FOUND_RE) as exc_info:
             coffee_lot_command_service.handle_delete_coffee_lot(command)
 
-        logger.info(f"Excepcion capturada: {type(exc_info.value).__name__}")
-        logger.info(f"Mensaje de error: {str(exc_info.value)}")
+        logger.info("Mensaje de error: %s", exc_info.value)
 
-        assert "not found" in str(exc_info.value).lower(), \
-            "El error debe indicar que el lote no fue encontrado"
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
         logger.info("OK: Validacion de existencia funcionando correctamente")
\ No newline at end of file
@@ -15,10 +15,42 @@ Ejecutar un test específico:
 
 import pytest
 import logging
+import numpy as np
 from grain_classification.domain.model.aggregates.classification_session import SessionStatus
 
 logger = logging.getLogger(__name__)
 
+# Estados de sesión esperados por los tests
+_COMPLETED = SessionStatus.COMPLETED
+_FAILED = SessionStatus.FAILED
+
+# Predicciones de color del lote mixto: un grano bueno y uno defectuoso
+_COLOR_GOOD = {'Light': 90.0, 'Medium': 5.0, 'Dark': 3.0, 'Green': 2.0}
+_COLOR_DEFECT = {'Light': 10.0, 'Medium': 10.0, 'Dark': 75.0, 'Green': 5.0}
+
+# Columnas numéricas por grano para operar sobre los análisis de forma vectorizada
+_ANALYSIS_DTYPE = np.dtype([
+    ('base_score', 'f8'),
+    ('final_score', 'f8'),
+    ('shape_penalty', 'f8'),
+])
+
+
+def _analyses_to_ndarray(analyses):
+    """
+    Vuelca los análisis de granos en un arreglo estructurado (_ANALYSIS_DTYPE).
+    Los ajustes ausentes o nulos, como shape_penalty, quedan como NaN.
+    """
+    arr = np.empty(len(analyses), dtype=_ANALYSIS_DTYPE)
+    for i, analysis in enumerate(analyses):
+        assessment = analysis.quality_assessment or {}
+        arr[i] = (
+            assessment.get('base_score', np.nan),
+            analysis.final_score,
+            (assessment.get('adjustments') or {}).get('shape_penalty', np.nan),
+        )
+    return arr
+
 
 @pytest.mark.us12
 @pytest.mark.integration
@@ -30,9 +62,8 @@ class TestUS12DeteccionDefectosCriticos:
 
     def test_detectar_granos_con_grietas(
             self,
-            classification_service,
-            mock_cv_service,
-            sample_image_bytes
+            run_session,
+            mock_cv_service
     ):
         """
         Verifica que el sistema detecte granos con grietas mediante análisis CV.
@@ -55,156 +86,96 @@ class TestUS12DeteccionDefectosCriticos:
 
         # Act: Procesar clasificación
         logger.info("ACT: Iniciando sesion de clasificacion con imagen de test")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
-        logger.info(f"Total de granos analizados: {session.total_grains_analyzed}")
+        session = run_session()
+        logger.info("Sesion creada con status: %s", session.status)
+        logger.info("Total de granos analizados: %s", session.total_grains_analyzed)
 
         # Assert: Verificar detección exitosa
         logger.info("ASSERT: Verificando deteccion exitosa de grietas")
-        assert session.status == SessionStatus.COMPLETED, \
-            "La sesión debe completarse exitosamente"
+        assert session.status is _COMPLETED
         logger.info("OK: Sesion completada exitosamente")
 
-        assert session.total_grains_analyzed > 0, \
-            "Debe haber granos analizados"
-        logger.info(f"OK: Se analizaron {session.total_grains_analyzed} granos")
+        assert session.total_grains_analyzed > 0
+        logger.info("OK: Se analizaron %s granos", session.total_grains_analyzed)
 
         # Verificar que al menos un grano tiene grietas detectadas
-        analyses_with_cracks = [
-            a for a in session.analyses
-            if a.features.get('has_cracks') == 'True'
-        ]
-        logger.info(f"Granos con grietas detectados: {len(analyses_with_cracks)}")
+        has_cracked_grain = any(
+            analysis.features.get('has_cracks') == 'True' for analysis in session.analyses
+        )
+        logger.info("Granos con grietas detectados: %s", has_cracked_grain)
 
-        assert len(analyses_with_cracks) > 0, \
-            "Debe detectarse al menos un grano con grietas"
+        assert has_cracked_grain
         logger.info("OK: Test completado exitosamente")
 
-    def test_detectar_granos_oscuros_defectuosos(
+    @pytest.mark.parametrize("color_pcts,expected_class,expected_cats,score_ok", [
+        (
+            {'Light': 5.0, 'Medium': 10.0, 'Dark': 80.0, 'Green': 5.0},  # Moho/fermentación
+            'Dark',
+            ['C', 'B'],
+            lambda score: score < 0.7
+        ),
+        (
+            {'Light': 5.0, 'Medium': 10.0, 'Dark': 5.0, 'Green': 80.0},  # Grano inmaduro
+            'Green',
+            ['C'],
+            lambda score: score <= 0.5
+        ),
+    ], ids=["oscuros_defectuosos", "verdes_inmaduros"])
+    def test_detectar_granos_por_color(
             self,
-            classification_service,
-            mock_ml_predictor,
-            sample_image_bytes
+            color_pcts,
+            expected_class,
+            expected_cats,
+            score_ok,
+            run_session,
+            mock_ml_predictor
     ):
         """
-        Verifica que granos oscuros (moho/fermentación) se clasifiquen como defectuosos.
+        Verifica que granos oscuros (moho/fermentación) y verdes (inmaduros) se
+        clasifiquen en categorías bajas.
 
-        GIVEN un lote con granos oscuros (indicador de moho/fermentación)
+        GIVEN un lote con granos predominantemente oscuros o verdes
         WHEN se clasifica la imagen
-        THEN el sistema debe identificarlos como categoría C (defectuosos)
+        THEN el sistema debe identificarlos como defectuosos con score bajo
         """
-        logger.info("=== TEST: Deteccion de granos oscuros defectuosos ===")
-
-        # Arrange: Configurar predicción de grano oscuro
-        logger.info("ARRANGE: Configurando predictor ML con grano oscuro (80% Dark)")
-        mock_ml_predictor.predict_color_percentages.return_value = {
-            'Light': 5.0,
-            'Medium': 10.0,
-            'Dark': 80.0,  # Grano predominantemente oscuro
-            'Green': 5.0
-        }
-        logger.info("Prediccion configurada: Dark=80% (indicador de defecto)")
+        logger.info("=== TEST: Deteccion de granos de color %s ===", expected_class)
+
+        # Arrange: Configurar predicción del color defectuoso
+        logger.info("ARRANGE: Configurando predictor ML con grano %s (80%%)", expected_class)
+        mock_ml_predictor.predict_color_percentages.return_value = color_pcts
 
         # Act: Procesar clasificación
-        logger.info("ACT: Procesando clasificacion con grano oscuro")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        logger.info("ACT: Procesando clasificacion con grano %s", expected_class)
+        session = run_session()
+        logger.info("Sesion creada con status: %s", session.status)
 
         # Assert: Verificar clasificación baja
         logger.info("ASSERT: Verificando clasificacion como defectuoso")
-        assert session.status == SessionStatus.COMPLETED
-        logger.info("OK: Sesion completada")
-
-        dark_grains = [
-            a for a in session.analyses
-            if a.quality_assessment.get('color_class') == 'Dark'
-        ]
-        logger.info(f"Granos oscuros detectados: {len(dark_grains)}")
-
-        assert len(dark_grains) > 0, \
-            "Debe detectarse al menos un grano oscuro"
-        logger.info("OK: Se detectaron granos oscuros")
-
-        for grain in dark_grains:
-            logger.info(f"Grano oscuro: categoria={grain.final_category}, score={grain.final_score:.3f}")
-            assert grain.final_category in ['C', 'B'], \
-                f"Grano oscuro debe ser categoría baja, obtuvo: {grain.final_category}"
-            assert grain.final_score < 0.7, \
-                f"Grano oscuro debe tener score bajo, obtuvo: {grain.final_score}"
-
-        logger.info("OK: Todos los granos oscuros clasificados correctamente")
-
-    def test_detectar_granos_verdes_inmaduros(
-            self,
-            classification_service,
-            mock_ml_predictor,
-            sample_image_bytes
-    ):
-        """
-        Verifica que granos verdes (inmaduros) se identifiquen como defectos de maduración.
-
-        GIVEN un lote con granos verdes (inmaduros)
-        WHEN se procesa la clasificación
-        THEN el sistema debe identificarlos como defectos de maduración
-        """
-        logger.info("=== TEST: Deteccion de granos verdes inmaduros ===")
-
-        # Arrange: Configurar grano verde inmaduro
-        logger.info("ARRANGE: Configurando predictor ML con grano verde (80% Green)")
-        mock_ml_predictor.predict_color_percentages.return_value = {
-            'Light': 5.0,
-            'Medium': 10.0,
-            'Dark': 5.0,
-            'Green': 80.0  # Grano inmaduro
-        }
-        logger.info("Prediccion configurada: Green=80% (grano inmaduro)")
-
-        # Act: Procesar clasificación
-        logger.info("ACT: Procesando clasificacion con grano verde")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
-
-        # Assert: Verificar detección de granos verdes
-        logger.info("ASSERT: Verificando clasificacion como categoria C")
-        assert session.status == SessionStatus.COMPLETED
+        assert session.status is _COMPLETED
         logger.info("OK: Sesion completada")
 
-        green_grains = [
-            a for a in session.analyses
-            if a.quality_assessment.get('color_class') == 'Green'
+        grains = [
+            analysis for analysis in session.analyses
+            if analysis.quality_assessment.get('color_class') == expected_class
         ]
-        logger.info(f"Granos verdes detectados: {len(green_grains)}")
+        logger.info("Granos %s detectados: %s", expected_class, len(grains))
 
-        assert len(green_grains) > 0, \
-            "Debe detectarse al menos un grano verde"
-        logger.info("OK: Se detectaron granos verdes")
+        assert grains, \
+            f"Debe detectarse al menos un grano {expected_class}"
+        logger.info("OK: Se detectaron granos %s", expected_class)
 
-        for grain in green_grains:
-            logger.info(f"Grano verde: categoria={grain.final_category}, score={grain.final_score:.3f}")
-            assert grain.final_category == 'C', \
-                f"Grano verde debe ser categoría C, obtuvo: {grain.final_category}"
-            assert grain.final_score <= 0.5, \
-                f"Grano verde debe tener score muy bajo, obtuvo: {grain.final_score}"
+        for grain in grains:
+            assert grain.final_category in expected_cats, \
+                f"Grano {expected_class} debe ser categoría {expected_cats}, obtuvo: {grain.final_category}"
+            assert score_ok(grain.final_score), \
+                f"Grano {expected_class} debe tener score bajo, obtuvo: {grain.final_score}"
 
-        logger.info("OK: Todos los granos verdes clasificados como categoria C")
+        logger.info("OK: %s granos %s clasificados correctamente", len(grains), expected_class)
 
     def test_penalizacion_por_forma_irregular(
             self,
-            classification_service,
-            mock_cv_service,
-            sample_image_bytes
+            run_session,
+            mock_cv_service
     ):
         """
         Verifica que granos con forma irregular reciban penalización en su score.
@@ -227,46 +198,33 @@ class TestUS12DeteccionDefectosCriticos:
 
         # Act: Procesar clasificación
         logger.info("ACT: Procesando clasificacion con grano irregular")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        session = run_session()
+        logger.info("Sesion creada con status: %s", session.status)
 
         # Assert: Verificar penalización
         logger.info("ASSERT: Verificando penalizacion por forma irregular")
-        assert session.status == SessionStatus.COMPLETED
+        assert session.status is _COMPLETED
         logger.info("OK: Sesion completada")
 
-        for analysis in session.analyses:
-            base_score = analysis.quality_assessment['base_score']
-            final_score = analysis.final_score
-
-            logger.info(f"Grano analizado: base_score={base_score:.3f}, final_score={final_score:.3f}")
-
-            # El score final debe ser menor o igual que el base por penalización
-            assert final_score <= base_score, \
-                f"Score final ({final_score}) debe ser <= base ({base_score})"
-            logger.info("OK: Score final menor o igual al base (penalizacion aplicada)")
+        analyses = _analyses_to_ndarray(session.analyses)
+        logger.info("Granos analizados: base_score=%s, final_score=%s",
+                    analyses['base_score'], analyses['final_score'])
 
-            # Debe existir penalización de forma
-            adjustments = analysis.quality_assessment.get('adjustments', {})
-            assert 'shape_penalty' in adjustments, \
-                "Debe existir penalización por forma irregular"
+        # El score final debe ser menor o igual que el base por penalización
+        assert np.all(analyses['final_score'] <= analyses['base_score']), \
+            f"Score final ({analyses['final_score']}) debe ser <= base ({analyses['base_score']})"
+        logger.info("OK: Score final menor o igual al base (penalizacion aplicada)")
 
-            shape_penalty = adjustments['shape_penalty']
-            logger.info(f"Penalizacion de forma: {shape_penalty:.3f}")
-
-            assert shape_penalty < 0, \
-                "La penalización de forma debe ser negativa"
-            logger.info("OK: Penalizacion de forma aplicada correctamente")
+        # Debe existir penalización de forma (NaN si falta) y ser negativa
+        logger.info("Penalizaciones de forma: %s", analyses['shape_penalty'])
+        assert np.all(analyses['shape_penalty'] < 0), \
+            "Debe existir una penalización de forma negativa por forma irregular"
+        logger.info("OK: Penalizacion de forma aplicada correctamente")
 
     def test_reporte_estadistico_defectos_lote(
             self,
-            classification_service,
-            mock_ml_predictor,
-            sample_image_bytes
+            run_session,
+            mock_ml_predictor
     ):
         """
         Verifica que el reporte final incluya estadísticas sobre defectos detectados.
@@ -279,61 +237,52 @@ class TestUS12DeteccionDefectosCriticos:
 
         # Arrange: Configurar lote mixto (algunos defectuosos)
         logger.info("ARRANGE: Configurando lote mixto (1 bueno, 1 defectuoso)")
-        mock_ml_predictor.predict_color_percentages.side_effect = [
-            {'Light': 90.0, 'Medium': 5.0, 'Dark': 3.0, 'Green': 2.0},  # Bueno
-            {'Light': 10.0, 'Medium': 10.0, 'Dark': 75.0, 'Green': 5.0},  # Defecto
-        ]
+        # Una sola respuesta vectorizada para todo el lote en lugar de una por grano
+        mock_ml_predictor.predict_color_percentages_batch.side_effect = None
+        mock_ml_predictor.predict_color_percentages_batch.return_value = [_COLOR_GOOD, _COLOR_DEFECT]
         logger.info("Granos configurados: 1 Light (bueno), 1 Dark (defectuoso)")
 
         # Act: Procesar clasificación
         logger.info("ACT: Procesando clasificacion del lote mixto")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        session = run_session()
+        logger.info("Sesion creada con status: %s", session.status)
 
         # Assert: Verificar reporte completo
         logger.info("ASSERT: Verificando estructura del reporte")
-        assert session.status == SessionStatus.COMPLETED
+        assert session.status is _COMPLETED
+        mock_ml_predictor.predict_color_percentages_batch.assert_called_once()
         logger.info("OK: Sesion completada")
 
-        assert session.classification_result is not None, \
-            "Debe existir un reporte de clasificación"
+        assert session.classification_result is not None
         logger.info("OK: Reporte de clasificacion generado")
 
         report = session.classification_result
 
         # Verificar estructura del reporte
-        assert 'total_beans_analyzed' in report, \
-            "Reporte debe incluir total de granos analizados"
-        logger.info(f"Total de granos analizados: {report['total_beans_analyzed']}")
+        assert 'total_beans_analyzed' in report
+        logger.info("Total de granos analizados: %s", report['total_beans_analyzed'])
 
-        assert 'category_distribution' in report, \
-            "Reporte debe incluir distribución por categorías"
+        assert 'category_distribution' in report
         logger.info("OK: Distribucion por categorias presente")
 
-        assert 'quality_breakdown' in report, \
-            "Reporte debe incluir desglose de calidad"
+        assert 'quality_breakdown' in report
         logger.info("OK: Desglose de calidad presente")
 
         # Verificar que se reportan categorías de calidad
         breakdown = report['quality_breakdown']
-        logger.info(f"Categorias en breakdown: {list(breakdown.keys())}")
+        logger.info("Categorias en breakdown: %s", breakdown.keys())
 
-        assert 'poor' in breakdown, \
-            "Debe existir categoría 'poor' para granos defectuosos"
-        logger.info(f"Granos defectuosos (poor): {breakdown['poor']}")
+        assert 'poor' in breakdown
+        logger.info("Granos defectuosos (poor): %s", breakdown['poor'])
 
-        assert breakdown['poor'] >= 0, \
-            "Conteo de granos defectuosos debe ser no negativo"
+        assert breakdown['poor'] >= 0
         logger.info("OK: Reporte estadistico completo y valido")
 
     def test_manejo_error_imagen_invalida(
             self,
-            classification_service,
-            mock_cv_service
+            run_session,
+            mock_cv_service,
+            sample_image_bytes_invalid
     ):
         """
         Verifica que el sistema maneje graciosamente imágenes inválidas o corruptas.
@@ -351,32 +300,65 @@ class TestUS12DeteccionDefectosCriticos:
 
         # Act: Intentar procesar imagen inválida
         logger.info("ACT: Intentando procesar imagen invalida")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=400,
-            image_bytes=b'invalid_data',
-            user_id=4
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        session = run_session(coffee_lot_id=400, user_id=4, image_bytes=sample_image_bytes_invalid)
+        logger.info("Sesion creada con status: %s", session.status)
 
         # Assert: Verificar manejo de error
         logger.info("ASSERT: Verificando manejo gracioso del error")
-        assert session.status == SessionStatus.FAILED, \
-            "La sesión debe marcar como FAILED cuando la imagen es inválida"
+        assert session.status is _FAILED
         logger.info("OK: Status marcado como FAILED")
 
-        assert 'error' in session.classification_result, \
-            "El resultado debe contener mensaje de error"
-        logger.info(f"Mensaje de error: {session.classification_result.get('error')}")
+        assert 'error' in session.classification_result
+        logger.info("Mensaje de error: %s", session.classification_result.get('error'))
 
-        assert len(session.analyses) == 0, \
-            "No debe haber análisis cuando la imagen es inválida"
+        assert len(session.analyses) == 0
         logger.info("OK: Error manejado graciosamente, sin analisis generados")
 
+    @pytest.mark.parametrize("batch_result,expected_error", [
+        (None, 'Modelo CNN no disponible'),
+        ([_COLOR_GOOD], 'devolvió 1 predicciones para 2 granos'),
+    ], ids=["prediccion_nula", "prediccion_incompleta"])
+    def test_manejo_error_prediccion_por_lote(
+            self,
+            run_session,
+            mock_ml_predictor,
+            batch_result,
+            expected_error
+    ):
+        """
+        Verifica que la sesión falle si la predicción por lote no cubre todos los granos.
+
+        GIVEN una imagen con dos granos segmentados
+        WHEN el modelo no devuelve predicción o devuelve menos predicciones que granos
+        THEN la sesión debe marcarse como FAILED sin análisis parciales
+        """
+        logger.info("=== TEST: Manejo de error en prediccion por lote ===")
+
+        # Arrange: Predicción por lote nula o con menos resultados que granos
+        logger.info("ARRANGE: Configurando predictor ML con resultado por lote: %s", batch_result)
+        mock_ml_predictor.predict_color_percentages_batch.side_effect = None
+        mock_ml_predictor.predict_color_percentages_batch.return_value = batch_result
+
+        # Act: Procesar clasificación
+        logger.info("ACT: Procesando clasificacion con prediccion por lote fallida")
+        session = run_session(coffee_lot_id=600, user_id=6)
+        logger.info("Sesion creada con status: %s", session.status)
+
+        # Assert: Verificar fallo sin análisis parciales
+        logger.info("ASSERT: Verificando que la sesion falle sin analisis parciales")
+        assert session.status is _FAILED
+        logger.info("OK: Status marcado como FAILED")
+
+        assert expected_error in session.classification_result['error']
+        logger.info("Mensaje de error: %s", session.classification_result['error'])
+
+        assert len(session.analyses) == 0
+        logger.info("OK: Prediccion por lote fallida manejada sin analisis parciales")
+
     def test_manejo_error_sin_granos_detectados(
             self,
-            classification_service,
-            mock_cv_service,
-            sample_image_bytes
+            run_session,
+            mock_cv_service
     ):
         """
         Verifica que el sistema maneje el caso donde no se detectan granos en la imagen.
@@ -394,20 +376,14 @@ class TestUS12DeteccionDefectosCriticos:
 
         # Act: Procesar clasificación
         logger.info("ACT: Procesando imagen sin granos")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=500,
-            image_bytes=sample_image_bytes,
-            user_id=5
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        session = run_session(coffee_lot_id=500, user_id=5)
+        logger.info("Sesion creada con status: %s", session.status)
 
         # Assert: Verificar fallo apropiado
         logger.info("ASSERT: Verificando mensaje de error apropiado")
-        assert session.status == SessionStatus.FAILED, \
-            "La sesión debe fallar cuando no hay granos"
+        assert session.status is _FAILED
         logger.info("OK: Status marcado como FAILED")
 
-        assert 'No se detectaron granos' in session.classification_result['error'], \
-            "El error debe indicar claramente que no se detectaron granos"
-        logger.info(f"Mensaje de error: {session.classification_result['error']}")
+        assert 'No se detectaron granos' in session.classification_result['error']
+        logger.info("Mensaje de error: %s", session.classification_result['error'])
         logger.info("OK: Error manejado correctamente con mensaje descriptivo")
\ No newline at end of file
@@ -14,10 +14,65 @@ Ejecutar un test específico:
 
 import pytest
 import logging
+import numpy as np
+from operator import itemgetter
+from types import MappingProxyType
 from grain_classification.domain.model.aggregates.classification_session import SessionStatus
 
+# Límite por test (pytest-timeout): una regresión que cuelgue el pipeline falla en vez de bloquear la suite
+pytestmark = [pytest.mark.timeout(5)]
+
 logger = logging.getLogger(__name__)
 
+# Estados de sesión esperados por los tests
+_COMPLETED = SessionStatus.COMPLETED
+
+# Claves que todo análisis de grano debe incluir
+_COLOR_ORDER = ('Light', 'Medium', 'Dark', 'Green')
+_COLOR_CLASSES = frozenset(_COLOR_ORDER)
+_MORPH_FEATURES = frozenset(('area', 'perimeter', 'circularity', 'has_cracks'))
+_ASSESSMENT_KEYS = frozenset(('base_score', 'final_score', 'quality_category'))
+
+# Medidas morfológicas numéricas de cada grano, para validarlas de forma vectorizada
+_MEASURES_DTYPE = np.dtype([('area', 'f8'), ('perimeter', 'f8'), ('circularity', 'f8')])
+
+# Suma esperada de los porcentajes de color de un grano (±5 puntos)
+_APPROX_100 = pytest.approx(100.0, abs=5.0)
+
+# Ajustes vacíos de solo lectura para granos sin 'adjustments'
+_NO_ADJUSTMENTS = MappingProxyType({})
+
+# Porcentaje de una entrada de category_distribution
+_get_percentage = itemgetter('percentage')
+
+# Predicciones de color del predictor mockeado; vistas de solo lectura compartidas entre tests
+_PRECISE_COLORS = MappingProxyType({'Light': 15.5, 'Medium': 70.2, 'Dark': 10.3, 'Green': 4.0})
+# Todos similares -> alta uniformidad
+_UNIFORM_COLORS = MappingProxyType({'Light': 5.0, 'Medium': 85.0, 'Dark': 5.0, 'Green': 5.0})
+# Lotes comparados: Productor A (calidad alta) y B (calidad media)
+_PRODUCER_A_COLORS = MappingProxyType({'Light': 80.0, 'Medium': 15.0, 'Dark': 3.0, 'Green': 2.0})
+_PRODUCER_B_COLORS = MappingProxyType({'Light': 20.0, 'Medium': 60.0, 'Dark': 15.0, 'Green': 5.0})
+
+# Características de un grano pequeño y uno grande; vistas de solo lectura compartidas entre tests
+_SMALL_BEAN_FEATURES = MappingProxyType(
+    {'area': 800.0, 'perimeter': 150.0, 'circularity': 0.8, 'has_cracks': 'False'}
+)
+_LARGE_BEAN_FEATURES = MappingProxyType(
+    {'area': 2500.0, 'perimeter': 220.0, 'circularity': 0.85, 'has_cracks': 'False'}
+)
+
+
+def _require_completed(session):
+    """
+    Corta el test en cuanto la sesión no terminó en COMPLETED, antes de validar sus análisis.
+
+    Returns:
+        list: Análisis de granos de la sesión
+    """
+    assert session.status is _COMPLETED, \
+        f"La sesión debe completarse, status: {session.status}, resultado: {session.classification_result}"
+    return session.analyses
+
 
 @pytest.mark.us13
 @pytest.mark.integration
@@ -29,9 +84,8 @@ class TestUS13AnalisisColorUniformidad:
 
     def test_medicion_porcentajes_color_precisa(
             self,
-            classification_service,
-            mock_ml_predictor,
-            sample_image_bytes
+            run_session,
+            mock_ml_predictor
     ):
         """
         Verifica que el sistema retorne porcentajes precisos para todas las clases de color.
@@ -44,51 +98,43 @@ class TestUS13AnalisisColorUniformidad:
 
         # Arrange: Configurar predicción detallada
         logger.info("ARRANGE: Configurando predictor ML con porcentajes detallados")
-        mock_ml_predictor.predict_color_percentages.return_value = {
-            'Light': 15.5,
-            'Medium': 70.2,
-            'Dark': 10.3,
-            'Green': 4.0
-        }
+        mock_ml_predictor.predict_color_percentages.return_value = _PRECISE_COLORS
         logger.info("Prediccion configurada: Light=15.5%, Medium=70.2%, Dark=10.3%, Green=4.0%")
 
         # Act: Procesar clasificación
         logger.info("ACT: Procesando clasificacion con analisis de color")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        session = run_session()
+        logger.info("Sesion creada con status: %s", session.status)
 
         # Assert: Verificar análisis de color completo
         logger.info("ASSERT: Verificando analisis de color completo")
-        assert session.status == SessionStatus.COMPLETED
+        analyses = _require_completed(session)
         logger.info("OK: Sesion completada")
 
-        for analysis in session.analyses:
+        for analysis in analyses:
             color_percentages = analysis.color_percentages
-            logger.info(f"Porcentajes de color detectados: {color_percentages}")
+            logger.info("Porcentajes de color detectados: %s", color_percentages)
 
             # Verificar que existen todas las clases de color
-            expected_classes = ['Light', 'Medium', 'Dark', 'Green']
-            for color_class in expected_classes:
-                assert color_class in color_percentages, \
-                    f"Debe existir la clase de color: {color_class}"
+            assert _COLOR_CLASSES <= color_percentages.keys(), \
+                f"Faltan clases de color: {_COLOR_CLASSES - color_percentages.keys()}"
             logger.info("OK: Todas las clases de color presentes")
 
-            # Verificar que los valores suman aproximadamente 100%
-            total = sum(color_percentages.values())
-            logger.info(f"Suma total de porcentajes: {total:.2f}%")
-            assert 95.0 <= total <= 105.0, \
-                f"Los porcentajes deben sumar ~100%, suma actual: {total}%"
-            logger.info("OK: Porcentajes suman aproximadamente 100%")
+        # Verificar que los valores de cada grano suman aproximadamente 100% (una sola reducción)
+        color_matrix = np.array([
+            [analysis.color_percentages[color_class] for color_class in _COLOR_ORDER]
+            for analysis in analyses
+        ])
+        totals = color_matrix.sum(axis=1)
+        logger.info("Suma total de porcentajes por grano: %s", totals)
+        assert totals == _APPROX_100, \
+            f"Los porcentajes deben sumar ~100%, sumas actuales: {totals}"
+        logger.info("OK: Porcentajes suman aproximadamente 100%")
 
     def test_medicion_tamano_grano_area(
             self,
-            classification_service,
-            mock_cv_service,
-            sample_image_bytes
+            run_session,
+            mock_cv_service
     ):
         """
         Verifica que el sistema mida y reporte el área de cada grano correctamente.
@@ -101,159 +147,103 @@ class TestUS13AnalisisColorUniformidad:
 
         # Arrange: Configurar diferentes tamaños de granos
         logger.info("ARRANGE: Configurando CV con granos de diferentes tamanos")
-        mock_cv_service.extract_all_features.side_effect = [
-            {'area': 800.0, 'perimeter': 150.0, 'circularity': 0.8, 'has_cracks': 'False'},
-            {'area': 2500.0, 'perimeter': 220.0, 'circularity': 0.85, 'has_cracks': 'False'}
-        ]
+        mock_cv_service.extract_all_features.side_effect = (_SMALL_BEAN_FEATURES, _LARGE_BEAN_FEATURES)
         logger.info("Granos configurados: area=800.0 (pequeno), area=2500.0 (grande)")
 
         # Act: Procesar clasificación
         logger.info("ACT: Procesando clasificacion con medicion de tamano")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        session = run_session()
+        logger.info("Sesion creada con status: %s", session.status)
 
         # Assert: Verificar mediciones de tamaño
         logger.info("ASSERT: Verificando mediciones de area")
-        assert session.status == SessionStatus.COMPLETED
+        analyses = _require_completed(session)
         logger.info("OK: Sesion completada")
 
-        assert len(session.analyses) == 2, \
+        assert len(analyses) == 2, \
             "Deben haberse analizado 2 granos"
-        logger.info(f"OK: Se analizaron {len(session.analyses)} granos")
-
-        for i, analysis in enumerate(session.analyses):
-            area = analysis.features.get('area')
-            logger.info(f"Grano {i+1}: area={area}")
+        logger.info("OK: Se analizaron %s granos", len(analyses))
 
+        for analysis in analyses:
             assert 'area' in analysis.features, \
                 "Las características deben incluir el área"
-            assert area > 0, \
-                "El área debe ser un valor positivo"
-            assert isinstance(area, (int, float)), \
+            assert isinstance(analysis.features['area'], (int, float)), \
                 "El área debe ser un valor numérico"
 
+        # Validar la positividad de todas las áreas en una sola pasada vectorizada
+        areas = np.fromiter((analysis.features['area'] for analysis in analyses), dtype=np.float64,
+                            count=len(analyses))
+        logger.info("Areas medidas: %s", areas)
+        assert np.all(areas > 0), f"El área debe ser un valor positivo: {areas}"
+
         logger.info("OK: Areas medidas correctamente para todos los granos")
 
-    def test_bonificacion_por_tamano_grande(
+    @pytest.mark.parametrize("features,adjustment_key,adjustment_ok,score_ok", [
+        (
+            {'area': 2500.0, 'perimeter': 220.0, 'circularity': 0.85, 'has_cracks': 'False'},  # > 2000
+            'size_bonus',
+            lambda adjustment: adjustment > 0,
+            lambda final_score, base_score: final_score >= base_score
+        ),
+        (
+            {'area': 400.0, 'perimeter': 100.0, 'circularity': 0.8, 'has_cracks': 'False'},  # < 500
+            'size_penalty',
+            lambda adjustment: adjustment < 0,
+            lambda final_score, base_score: final_score <= base_score
+        ),
+    ], ids=["bonificacion_grande", "penalizacion_pequeno"])
+    def test_ajuste_por_tamano(
             self,
-            classification_service,
-            mock_cv_service,
-            sample_image_bytes
+            features,
+            adjustment_key,
+            adjustment_ok,
+            score_ok,
+            run_session,
+            mock_cv_service
     ):
         """
-        Verifica que granos grandes reciban bonificación en su score de calidad.
+        Verifica que granos grandes reciban bonificación y granos pequeños
+        penalización en su score de calidad.
 
-        GIVEN granos de tamaño grande (>2000 área)
+        GIVEN granos de tamaño grande (>2000 área) o pequeño (<500 área)
         WHEN se calcula la calidad final
-        THEN debe aplicar bonificación al score
-        """
-        logger.info("=== TEST: Bonificacion por tamano grande ===")
-
-        # Arrange: Configurar grano grande
-        logger.info("ARRANGE: Configurando CV con grano grande (area=2500)")
-        mock_cv_service.extract_all_features.return_value = {
-            'area': 2500.0,  # Grano grande (> 2000)
-            'perimeter': 220.0,
-            'circularity': 0.85,
-            'has_cracks': 'False'
-        }
-        logger.info("Mock configurado: area=2500 (grande), circularidad=0.85")
-
-        # Act: Procesar clasificación
-        logger.info("ACT: Procesando clasificacion con grano grande")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
-
-        # Assert: Verificar bonificación
-        logger.info("ASSERT: Verificando bonificacion por tamano")
-        assert session.status == SessionStatus.COMPLETED
-        logger.info("OK: Sesion completada")
-
-        for analysis in session.analyses:
-            adjustments = analysis.quality_assessment.get('adjustments', {})
-            size_bonus = adjustments.get('size_bonus', 0)
-            base_score = analysis.quality_assessment['base_score']
-            final_score = analysis.final_score
-
-            logger.info(f"Analisis: base_score={base_score:.3f}, size_bonus={size_bonus:.3f}, final_score={final_score:.3f}")
-
-            # Debe tener bonificación de tamaño
-            assert 'size_bonus' in adjustments, \
-                "Granos grandes deben tener bonificación de tamaño"
-            assert size_bonus > 0, \
-                f"La bonificación debe ser positiva, obtuvo: {size_bonus}"
-            logger.info("OK: Bonificacion de tamano positiva aplicada")
-
-            # Score final debe ser mayor o igual que base
-            assert final_score >= base_score, \
-                f"Score final ({final_score}) debe ser >= base ({base_score})"
-            logger.info("OK: Score final mayor o igual al base (bonificacion aplicada)")
-
-    def test_penalizacion_por_tamano_pequeno(
-            self,
-            classification_service,
-            mock_cv_service,
-            sample_image_bytes
-    ):
+        THEN debe aplicar el ajuste de tamaño correspondiente al score
         """
-        Verifica que granos pequeños reciban penalización en su score de calidad.
+        logger.info("=== TEST: Ajuste por tamano (%s) ===", adjustment_key)
 
-        GIVEN granos de tamaño pequeño (<500 área)
-        WHEN se calcula la calidad final
-        THEN debe aplicar penalización al score
-        """
-        logger.info("=== TEST: Penalizacion por tamano pequeno ===")
-
-        # Arrange: Configurar grano pequeño
-        logger.info("ARRANGE: Configurando CV con grano pequeno (area=400)")
-        mock_cv_service.extract_all_features.return_value = {
-            'area': 400.0,  # Grano pequeño (< 500)
-            'perimeter': 100.0,
-            'circularity': 0.8,
-            'has_cracks': 'False'
-        }
-        logger.info("Mock configurado: area=400 (pequeno), circularidad=0.8")
+        # Arrange: Configurar tamaño del grano
+        logger.info("ARRANGE: Configurando CV con area=%s", features['area'])
+        mock_cv_service.extract_all_features.return_value = features
 
         # Act: Procesar clasificación
-        logger.info("ACT: Procesando clasificacion con grano pequeno")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        logger.info("ACT: Procesando clasificacion")
+        session = run_session()
+        logger.info("Sesion creada con status: %s", session.status)
 
-        # Assert: Verificar penalización
-        logger.info("ASSERT: Verificando penalizacion por tamano")
-        assert session.status == SessionStatus.COMPLETED
+        # Assert: Verificar ajuste de tamaño
+        logger.info("ASSERT: Verificando %s", adjustment_key)
+        analyses = _require_completed(session)
         logger.info("OK: Sesion completada")
 
-        for analysis in session.analyses:
-            adjustments = analysis.quality_assessment.get('adjustments', {})
-            size_penalty = adjustments.get('size_penalty', 0)
+        for analysis in analyses:
+            quality_assessment = analysis.quality_assessment
+            adjustments = quality_assessment.get('adjustments') or _NO_ADJUSTMENTS
+            base_score = quality_assessment['base_score']
+            final_score = analysis.final_score
 
-            logger.info(f"Penalizacion de tamano: {size_penalty:.3f}")
+            assert adjustment_key in adjustments, \
+                f"El grano debe tener el ajuste '{adjustment_key}', obtuvo: {adjustments}"
+            assert adjustment_ok(adjustments[adjustment_key]), \
+                f"Ajuste '{adjustment_key}' con signo incorrecto: {adjustments[adjustment_key]}"
+            assert score_ok(final_score, base_score), \
+                f"Score final ({final_score}) inconsistente con base ({base_score})"
 
-            # Debe tener penalización de tamaño
-            assert 'size_penalty' in adjustments, \
-                "Granos pequeños deben tener penalización de tamaño"
-            assert size_penalty < 0, \
-                f"La penalización debe ser negativa, obtuvo: {size_penalty}"
-            logger.info("OK: Penalizacion de tamano negativa aplicada correctamente")
+        logger.info("OK: %s aplicado en %s granos", adjustment_key, len(analyses))
 
     def test_uniformidad_lote_homogeneo(
             self,
-            classification_service,
-            mock_ml_predictor,
-            sample_image_bytes
+            run_session,
+            mock_ml_predictor
     ):
         """
         Verifica que el sistema detecte alta uniformidad en lotes homogéneos.
@@ -266,38 +256,27 @@ class TestUS13AnalisisColorUniformidad:
 
         # Arrange: Configurar lote uniforme (todos Medium)
         logger.info("ARRANGE: Configurando predictor ML con lote uniforme (85% Medium)")
-        mock_ml_predictor.predict_color_percentages.return_value = {
-            'Light': 5.0,
-            'Medium': 85.0,  # Todos similares -> alta uniformidad
-            'Dark': 5.0,
-            'Green': 5.0
-        }
+        mock_ml_predictor.predict_color_percentages.return_value = _UNIFORM_COLORS
         logger.info("Prediccion configurada: Medium=85% (alta uniformidad)")
 
         # Act: Procesar clasificación
         logger.info("ACT: Procesando clasificacion de lote homogeneo")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        session = run_session()
+        logger.info("Sesion creada con status: %s", session.status)
 
         # Assert: Verificar uniformidad
         logger.info("ASSERT: Verificando alta uniformidad en distribucion")
-        assert session.status == SessionStatus.COMPLETED
+        _require_completed(session)
         logger.info("OK: Sesion completada")
 
         report = session.classification_result
         distribution = report['category_distribution']
 
-        logger.info(f"Distribucion de categorias: {distribution}")
+        logger.info("Distribucion de categorias: %s", distribution)
 
         # Encontrar categoría predominante
-        max_percentage = max(
-            cat['percentage'] for cat in distribution.values()
-        )
-        logger.info(f"Porcentaje maximo en una categoria: {max_percentage:.2f}%")
+        max_percentage = _get_percentage(max(distribution.values(), key=_get_percentage))
+        logger.info("Porcentaje maximo en una categoria: %.2f%%", max_percentage)
 
         # Alta uniformidad: >70% en una categoría
         assert max_percentage >= 70.0, \
@@ -306,8 +285,7 @@ class TestUS13AnalisisColorUniformidad:
 
     def test_almacenamiento_caracteristicas_completas(
             self,
-            classification_service,
-            sample_image_bytes
+            completed_session
     ):
         """
         Verifica que todas las características medidas se almacenen correctamente.
@@ -318,32 +296,25 @@ class TestUS13AnalisisColorUniformidad:
         """
         logger.info("=== TEST: Almacenamiento de caracteristicas completas ===")
 
-        # Act: Procesar clasificación
-        logger.info("ACT: Procesando clasificacion completa")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        # Act: Sesión procesada por el fixture completed_session
+        session = completed_session
+        logger.info("Sesion creada con status: %s", session.status)
 
         # Assert: Verificar almacenamiento completo
         logger.info("ASSERT: Verificando almacenamiento de todas las caracteristicas")
-        assert session.status == SessionStatus.COMPLETED
+        analyses = _require_completed(session)
         logger.info("OK: Sesion completada")
 
-        for i, analysis in enumerate(session.analyses):
-            logger.info(f"Verificando grano {i+1}...")
+        for i, analysis in enumerate(analyses):
+            logger.info("Verificando grano %s...", i+1)
 
             # Verificar características morfológicas
             assert analysis.features is not None, \
                 "Debe existir diccionario de características"
-            logger.info(f"  Features: {list(analysis.features.keys())}")
+            logger.info("  Features: %s", analysis.features.keys())
 
-            required_features = ['area', 'perimeter', 'circularity', 'has_cracks']
-            for feature in required_features:
-                assert feature in analysis.features, \
-                    f"Debe existir la característica: {feature}"
+            assert _MORPH_FEATURES <= analysis.features.keys(), \
+                f"Faltan características: {_MORPH_FEATURES - analysis.features.keys()}"
             logger.info("  OK: Caracteristicas morfologicas completas")
 
             # Verificar análisis de color
@@ -351,27 +322,40 @@ class TestUS13AnalisisColorUniformidad:
                 "Debe existir análisis de color"
             assert len(analysis.color_percentages) == 4, \
                 "Debe haber 4 clases de color"
-            logger.info(f"  Color percentages: {analysis.color_percentages}")
+            logger.info("  Color percentages: %s", analysis.color_percentages)
             logger.info("  OK: Analisis de color completo")
 
             # Verificar evaluación de calidad
-            assert analysis.quality_assessment is not None, \
+            quality_assessment = analysis.quality_assessment
+            assert quality_assessment is not None, \
                 "Debe existir evaluación de calidad"
 
-            required_assessment_keys = ['base_score', 'final_score', 'quality_category']
-            for key in required_assessment_keys:
-                assert key in analysis.quality_assessment, \
-                    f"La evaluación debe incluir: {key}"
-            logger.info(f"  Quality assessment keys: {list(analysis.quality_assessment.keys())}")
+            assert _ASSESSMENT_KEYS <= quality_assessment.keys(), \
+                f"Faltan claves de evaluación: {_ASSESSMENT_KEYS - quality_assessment.keys()}"
+            logger.info("  Quality assessment keys: %s", quality_assessment.keys())
             logger.info("  OK: Evaluacion de calidad completa")
 
+        # Verificar las medidas numéricas de todos los granos en un solo arreglo estructurado
+        measures = np.fromiter(
+            (
+                (analysis.features['area'], analysis.features['perimeter'], analysis.features['circularity'])
+                for analysis in analyses
+            ),
+            dtype=_MEASURES_DTYPE,
+            count=len(analyses)
+        )
+        assert np.all(measures['area'] > 0), f"Áreas no positivas: {measures['area']}"
+        assert np.all(measures['perimeter'] > 0), f"Perímetros no positivos: {measures['perimeter']}"
+        assert np.all((measures['circularity'] > 0) & (measures['circularity'] <= 1)), \
+            f"Circularidad fuera de (0, 1]: {measures['circularity']}"
+        logger.info("OK: Medidas morfologicas numericas y validas")
+
         logger.info("OK: Todas las caracteristicas almacenadas correctamente")
 
     def test_comparacion_lotes_diferentes_productores(
             self,
-            classification_service,
-            mock_ml_predictor,
-            sample_image_bytes
+            run_session,
+            mock_ml_predictor
     ):
         """
         Verifica que el sistema permita comparar lotes de diferentes productores.
@@ -382,45 +366,28 @@ class TestUS13AnalisisColorUniformidad:
         """
         logger.info("=== TEST: Comparacion de lotes de diferentes productores ===")
 
-        # Arrange & Act: Procesar dos lotes de diferentes productores
-        # Lote 1 - Productor A (calidad alta)
-        logger.info("ARRANGE & ACT: Procesando Lote 1 (Productor A - calidad alta)")
-        mock_ml_predictor.predict_color_percentages.return_value = {
-            'Light': 80.0,
-            'Medium': 15.0,
-            'Dark': 3.0,
-            'Green': 2.0
-        }
-        logger.info("Lote 1: Light=80% (calidad alta)")
-
-        session1 = classification_service.start_classification_session(
-            coffee_lot_id=100,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Lote 1 procesado: status={session1.status}")
-
-        # Lote 2 - Productor B (calidad media)
-        logger.info("Procesando Lote 2 (Productor B - calidad media)")
-        mock_ml_predictor.predict_color_percentages.return_value = {
-            'Light': 20.0,
-            'Medium': 60.0,
-            'Dark': 15.0,
-            'Green': 5.0
-        }
-        logger.info("Lote 2: Medium=60% (calidad media)")
-
-        session2 = classification_service.start_classification_session(
-            coffee_lot_id=200,
-            image_bytes=sample_image_bytes,
-            user_id=2
+        # Arrange: Configurar una sola vez la predicción de cada lote, en orden de procesamiento
+        logger.info("ARRANGE: Lote 1 Light=80% (calidad alta), Lote 2 Medium=60% (calidad media)")
+        lot_colors = iter((_PRODUCER_A_COLORS, _PRODUCER_B_COLORS))
+
+        def predict_lot(images):
+            colors = next(lot_colors)
+            return [colors] * len(images)
+
+        mock_ml_predictor.predict_color_percentages_batch.side_effect = predict_lot
+
+        # Act: Procesar ambos lotes (Productor A y Productor B)
+        logger.info("ACT: Procesando Lote 1 (Productor A) y Lote 2 (Productor B)")
+        session1, session2 = (
+            run_session(coffee_lot_id=lot_id, user_id=user_id)
+            for lot_id, user_id in ((100, 1), (200, 2))
         )
-        logger.info(f"Lote 2 procesado: status={session2.status}")
+        logger.info("Lotes procesados: status=%s, %s", session1.status, session2.status)
 
         # Assert: Verificar que ambas sesiones son comparables
         logger.info("ASSERT: Verificando comparabilidad de lotes")
-        assert session1.status == SessionStatus.COMPLETED
-        assert session2.status == SessionStatus.COMPLETED
+        _require_completed(session1)
+        _require_completed(session2)
         logger.info("OK: Ambas sesiones completadas exitosamente")
 
         # Verificar que tienen estructura de datos comparable
@@ -437,8 +404,8 @@ class TestUS13AnalisisColorUniformidad:
         quality1 = report1['overall_batch_quality']
         quality2 = report2['overall_batch_quality']
 
-        logger.info(f"Calidad Lote 1 (Productor A): {quality1:.2f}")
-        logger.info(f"Calidad Lote 2 (Productor B): {quality2:.2f}")
+        logger.info("Calidad Lote 1 (Productor A): %.2f", quality1)
+        logger.info("Calidad Lote 2 (Productor B): %.2f", quality2)
 
         assert quality1 > quality2, \
             f"Lote con más granos Light debe tener mayor calidad: {quality1} vs {quality2}"
@@ -9,7 +9,7 @@ Ejecutar todos los tests de esta US:
     pytest us_14_integration_test.py -v
 
 Ejecutar un test específico:
-    pytest us_14_integration_test.py::TestUS14ClasificacionEstandaresInternacionales::test_clasificacion_categoria_specialty -v
+    pytest "us_14_integration_test.py::TestUS14ClasificacionEstandaresInternacionales::test_clasificacion_categoria[specialty]" -v
 """
 
 import pytest
@@ -19,142 +19,95 @@ from grain_classification.domain.model.aggregates.classification_session import
     ClassificationSession
 )
 
+pytestmark = [pytest.mark.us14, pytest.mark.integration]
+
 logger = logging.getLogger(__name__)
 
+# Estados de sesión esperados por los tests
+_COMPLETED = SessionStatus.COMPLETED
+
+# Categorías de exportación válidas (distribución y categoría predominante del reporte)
+_EXPECTED_CATEGORIES = frozenset(('Specialty', 'Premium', 'A', 'B', 'C'))
+
 
-@pytest.mark.us14
-@pytest.mark.integration
 class TestUS14ClasificacionEstandaresInternacionales:
     """
     Suite de tests de integración para la clasificación automática según
     estándares de exportación reconocidos internacionalmente.
     """
 
-    def test_clasificacion_categoria_specialty(
+    @pytest.mark.parametrize("color_prediction,expected_cat,score_lo,score_hi,color_class", [
+        (
+            {'Light': 95.0, 'Medium': 3.0, 'Dark': 1.0, 'Green': 1.0},  # Máxima calidad
+            'Specialty',
+            0.9,
+            float('inf'),
+            'Light'
+        ),
+        (
+            {'Light': 5.0, 'Medium': 88.0, 'Dark': 4.0, 'Green': 3.0},  # Alta calidad, color medio
+            'Premium',
+            0.8,
+            0.9,
+            None
+        ),
+    ], ids=["specialty", "premium"], indirect=["color_prediction"])
+    def test_clasificacion_categoria(
             self,
-            classification_service,
-            mock_ml_predictor,
-            sample_image_bytes
+            color_prediction,
+            expected_cat,
+            score_lo,
+            score_hi,
+            color_class,
+            run_session
     ):
         """
-        Verifica que granos de máxima calidad se clasifiquen como 'Specialty' (≥90%).
+        Verifica que granos de máxima calidad se clasifiquen como 'Specialty' (≥90%)
+        y los de alta calidad como 'Premium' (80-89%).
 
-        GIVEN granos de máxima calidad (Light, sin defectos)
+        GIVEN granos de máxima calidad (Light) o alta calidad (Medium)
         WHEN se evalúan según estándares
-        THEN deben clasificarse como 'Specialty' (≥90%)
-        """
-        logger.info("=== TEST: Clasificacion categoria Specialty ===")
-
-        # Arrange: Configurar grano Specialty
-        logger.info("ARRANGE: Configurando predictor ML con grano Specialty (95% Light)")
-        mock_ml_predictor.predict_color_percentages.return_value = {
-            'Light': 95.0,  # Color premium
-            'Medium': 3.0,
-            'Dark': 1.0,
-            'Green': 1.0
-        }
-        logger.info("Prediccion configurada: Light=95% (maxima calidad)")
-
-        # Act: Procesar clasificación
-        logger.info("ACT: Procesando clasificacion de grano Specialty")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
-
-        # Assert: Verificar categoría Specialty
-        logger.info("ASSERT: Verificando clasificacion como Specialty")
-        assert session.status == SessionStatus.COMPLETED
-        logger.info("OK: Sesion completada")
-
-        specialty_grains = [
-            a for a in session.analyses
-            if a.final_category == 'Specialty'
-        ]
-        logger.info(f"Granos clasificados como Specialty: {len(specialty_grains)}")
-
-        assert len(specialty_grains) > 0, \
-            "Debe haber al menos un grano clasificado como Specialty"
-        logger.info("OK: Se detectaron granos Specialty")
-
-        for grain in specialty_grains:
-            logger.info(f"Grano Specialty: score={grain.final_score:.3f}, color={grain.quality_assessment['color_class']}")
-
-            assert grain.final_score >= 0.9, \
-                f"Specialty requiere score ≥0.9, obtuvo: {grain.final_score}"
-            logger.info("  OK: Score >= 0.9 (cumple estandar Specialty)")
-
-            assert grain.quality_assessment['color_class'] == 'Light', \
-                f"Specialty debe ser Light, obtuvo: {grain.quality_assessment['color_class']}"
-            logger.info("  OK: Color Light (calidad premium)")
-
-        logger.info("OK: Clasificacion Specialty exitosa")
-
-    def test_clasificacion_categoria_premium(
-            self,
-            classification_service,
-            mock_ml_predictor,
-            sample_image_bytes
-    ):
+        THEN deben clasificarse en la categoría con su rango de score
         """
-        Verifica que granos de alta calidad se clasifiquen como 'Premium' (80-89%).
+        logger.info("=== TEST: Clasificacion categoria %s ===", expected_cat)
 
-        GIVEN granos de alta calidad (Medium, buena forma)
-        WHEN se evalúan según estándares
-        THEN deben clasificarse como 'Premium' (80-89%)
-        """
-        logger.info("=== TEST: Clasificacion categoria Premium ===")
-
-        # Arrange: Configurar grano Premium
-        logger.info("ARRANGE: Configurando predictor ML con grano Premium (88% Medium)")
-        mock_ml_predictor.predict_color_percentages.return_value = {
-            'Light': 5.0,
-            'Medium': 88.0,  # Color premium medio
-            'Dark': 4.0,
-            'Green': 3.0
-        }
-        logger.info("Prediccion configurada: Medium=88% (alta calidad)")
+        # Arrange: Predicción del grano configurada por el fixture color_prediction
+        logger.info("ARRANGE: Predictor ML configurado con grano %s", expected_cat)
 
         # Act: Procesar clasificación
-        logger.info("ACT: Procesando clasificacion de grano Premium")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
-
-        # Assert: Verificar categoría Premium
-        logger.info("ASSERT: Verificando clasificacion como Premium")
-        assert session.status == SessionStatus.COMPLETED
+        logger.info("ACT: Procesando clasificacion de grano %s", expected_cat)
+        session = run_session()
+        logger.info("Sesion creada con status: %s", session.status)
+
+        # Assert: Verificar categoría
+        logger.info("ASSERT: Verificando clasificacion como %s", expected_cat)
+        assert session.status is _COMPLETED
+        assert session.analyses, "La sesión debe tener análisis de granos"
         logger.info("OK: Sesion completada")
 
-        premium_grains = [
-            a for a in session.analyses
-            if a.final_category == 'Premium'
-        ]
-        logger.info(f"Granos clasificados como Premium: {len(premium_grains)}")
-
-        assert len(premium_grains) > 0, \
-            "Debe haber al menos un grano clasificado como Premium"
-        logger.info("OK: Se detectaron granos Premium")
-
-        for grain in premium_grains:
-            logger.info(f"Grano Premium: score={grain.final_score:.3f}")
+        # Una sola pasada: filtrar y validar cada grano de la categoría sin lista intermedia
+        category_count = 0
+        for grain in session.analyses:
+            if grain.final_category != expected_cat:
+                continue
+            category_count += 1
+            logger.info("Grano %s: score=%.3f", expected_cat, grain.final_score)
 
-            assert 0.8 <= grain.final_score < 0.9, \
-                f"Premium requiere 0.8 ≤ score < 0.9, obtuvo: {grain.final_score}"
-            logger.info("  OK: Score en rango 0.8-0.89 (cumple estandar Premium)")
+            assert score_lo <= grain.final_score < score_hi, \
+                f"{expected_cat} requiere {score_lo} ≤ score < {score_hi}, obtuvo: {grain.final_score}"
 
-        logger.info("OK: Clasificacion Premium exitosa")
+            if color_class is not None:
+                assert grain.quality_assessment['color_class'] == color_class, \
+                    f"{expected_cat} debe ser {color_class}, obtuvo: {grain.quality_assessment['color_class']}"
 
+        logger.info("Granos clasificados como %s: %s", expected_cat, category_count)
+        assert category_count > 0, \
+            f"Debe haber al menos un grano clasificado como {expected_cat}"
+        logger.info("OK: Clasificacion %s exitosa", expected_cat)
 
     def test_reporte_lote_calidad_promedio(
             self,
-            classification_service,
-            sample_image_bytes
+            default_session
     ):
         """
         Verifica que el reporte incluya la calidad promedio del lote en escala 0-100.
@@ -165,28 +118,24 @@ class TestUS14ClasificacionEstandaresInternacionales:
         """
         logger.info("=== TEST: Reporte de calidad promedio del lote ===")
 
-        # Act: Procesar clasificación
-        logger.info("ACT: Procesando clasificacion del lote")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        # Act: Sesión compartida por la clase (fixture default_session)
+        session = default_session
+        logger.info("Sesion creada con status: %s", session.status)
 
         # Assert: Verificar reporte de calidad
         logger.info("ASSERT: Verificando reporte de calidad promedio")
-        assert session.status == SessionStatus.COMPLETED
+        assert session.status is _COMPLETED
+        assert session.analyses, "La sesión debe tener análisis de granos"
         logger.info("OK: Sesion completada")
 
         report = session.classification_result
         assert 'overall_batch_quality' in report, \
             "Reporte debe incluir calidad general del lote"
-        logger.info(f"Calidad general del lote: {report['overall_batch_quality']:.2f}")
+        logger.info("Calidad general del lote: %.2f", report['overall_batch_quality'])
 
         assert 'average_score' in report, \
             "Reporte debe incluir score promedio"
-        logger.info(f"Score promedio: {report['average_score']:.3f}")
+        logger.info("Score promedio: %.3f", report['average_score'])
 
         # Verificar escala 0-100
         overall_quality = report['overall_batch_quality']
@@ -196,17 +145,15 @@ class TestUS14ClasificacionEstandaresInternacionales:
 
         # Verificar coherencia con average_score (0-1 scale)
         avg_score = report['average_score']
-        expected_quality = avg_score * 100
-        logger.info(f"Verificando coherencia: {overall_quality:.2f} vs {expected_quality:.2f}")
+        logger.info("Verificando coherencia: %.2f vs %.2f", overall_quality, avg_score * 100)
 
-        assert abs(overall_quality - expected_quality) < 0.1, \
+        assert overall_quality == pytest.approx(avg_score * 100, abs=0.1), \
             f"Calidad ({overall_quality}) debe ser coherente con score ({avg_score})"
         logger.info("OK: Calidad coherente con score promedio")
 
     def test_distribucion_categorias_por_lote(
             self,
-            classification_service,
-            sample_image_bytes
+            default_session
     ):
         """
         Verifica que el reporte muestre la distribución completa de categorías.
@@ -217,18 +164,14 @@ class TestUS14ClasificacionEstandaresInternacionales:
         """
         logger.info("=== TEST: Distribucion de categorias por lote ===")
 
-        # Act: Procesar clasificación
-        logger.info("ACT: Procesando clasificacion del lote")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        # Act: Sesión compartida por la clase (fixture default_session)
+        session = default_session
+        logger.info("Sesion creada con status: %s", session.status)
 
         # Assert: Verificar distribución
         logger.info("ASSERT: Verificando distribucion de categorias")
-        assert session.status == SessionStatus.COMPLETED
+        assert session.status is _COMPLETED
+        assert session.analyses, "La sesión debe tener análisis de granos"
         logger.info("OK: Sesion completada")
 
         report = session.classification_result
@@ -236,35 +179,28 @@ class TestUS14ClasificacionEstandaresInternacionales:
             "Reporte debe incluir distribución de categorías"
 
         distribution = report['category_distribution']
-        logger.info(f"Distribucion encontrada: {list(distribution.keys())}")
+        logger.info("Distribucion encontrada: %s", distribution.keys())
 
         # Verificar que existen todas las categorías esperadas
-        expected_categories = ['Specialty', 'Premium', 'A', 'B', 'C']
-        for category in expected_categories:
-            assert category in distribution, \
-                f"Distribución debe incluir categoría: {category}"
-
-            cat_data = distribution[category]
-            logger.info(f"  {category}: count={cat_data['count']}, percentage={cat_data['percentage']:.2f}%")
-
-            assert 'count' in cat_data, \
-                f"Categoría {category} debe tener 'count'"
-            assert 'percentage' in cat_data, \
-                f"Categoría {category} debe tener 'percentage'"
-
-            # Verificar tipos de datos
-            assert isinstance(cat_data['count'], int), \
-                "Count debe ser entero"
-            assert isinstance(cat_data['percentage'], (int, float)), \
-                "Percentage debe ser numérico"
+        missing = _EXPECTED_CATEGORIES - distribution.keys()
+        assert not missing, f"Distribución debe incluir categorías: {sorted(missing)}"
+
+        # Una sola pasada: estructura y tipos de datos de cada categoría
+        bad = [
+            category for category, cat_data in distribution.items()
+            if 'count' not in cat_data
+            or 'percentage' not in cat_data
+            or not isinstance(cat_data['count'], int)
+            or not isinstance(cat_data['percentage'], (int, float))
+        ]
+        assert not bad, \
+            f"Categorías sin 'count' entero o 'percentage' numérico: {bad}"
 
         logger.info("OK: Distribucion completa con todas las categorias")
 
     def test_categoria_predominante_lote(
             self,
-            classification_service,
-            mock_ml_predictor,
-            sample_image_bytes
+            default_session
     ):
         """
         Verifica que se identifique correctamente la categoría predominante del lote.
@@ -275,28 +211,15 @@ class TestUS14ClasificacionEstandaresInternacionales:
         """
         logger.info("=== TEST: Identificacion de categoria predominante ===")
 
-        # Arrange: Configurar lote predominantemente Premium
-        logger.info("ARRANGE: Configurando lote predominantemente Premium (85% Medium)")
-        mock_ml_predictor.predict_color_percentages.return_value = {
-            'Light': 5.0,
-            'Medium': 85.0,  # Mayoría Medium -> Premium
-            'Dark': 5.0,
-            'Green': 5.0
-        }
-        logger.info("Prediccion configurada: Medium=85% (mayoria Premium)")
-
-        # Act: Procesar clasificación
-        logger.info("ACT: Procesando clasificacion del lote")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        # Act: Sesión compartida por la clase (fixture default_session); la predicción
+        # por defecto del predictor ML ya es un lote predominantemente Premium (85% Medium)
+        session = default_session
+        logger.info("Sesion creada con status: %s", session.status)
 
         # Assert: Verificar categoría predominante
         logger.info("ASSERT: Verificando categoria predominante")
-        assert session.status == SessionStatus.COMPLETED
+        assert session.status is _COMPLETED
+        assert session.analyses, "La sesión debe tener análisis de granos"
         logger.info("OK: Sesion completada")
 
         report = session.classification_result
@@ -304,18 +227,15 @@ class TestUS14ClasificacionEstandaresInternacionales:
             "Reporte debe incluir categoría predominante"
 
         predominant = report['predominant_category']
-        logger.info(f"Categoria predominante detectada: {predominant}")
+        logger.info("Categoria predominante detectada: %s", predominant)
 
-        valid_categories = ['Specialty', 'Premium', 'A', 'B', 'C']
-        assert predominant in valid_categories, \
+        assert predominant in _EXPECTED_CATEGORIES, \
             f"Categoría predominante debe ser válida, obtuvo: {predominant}"
         logger.info("OK: Categoria predominante valida e identificada correctamente")
 
     def test_almacenamiento_imagen_cloudinary(
             self,
-            classification_service,
-            mock_cloudinary_service,
-            sample_image_bytes
+            default_run
     ):
         """
         Verifica que las imágenes se almacenen en Cloudinary con URL pública.
@@ -326,48 +246,41 @@ class TestUS14ClasificacionEstandaresInternacionales:
         """
         logger.info("=== TEST: Almacenamiento de imagenes en Cloudinary ===")
 
-        # Act: Procesar clasificación
-        logger.info("ACT: Procesando clasificacion con almacenamiento de imagenes")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        # Act: Sesión compartida por la clase con sus subidas registradas (fixture default_run)
+        session, _, upload_calls = default_run
+        logger.info("Sesion creada con status: %s", session.status)
 
         # Assert: Verificar almacenamiento
         logger.info("ASSERT: Verificando almacenamiento en Cloudinary")
-        assert session.status == SessionStatus.COMPLETED
+        assert session.status is _COMPLETED
+        assert session.analyses, "La sesión debe tener análisis de granos"
         logger.info("OK: Sesion completada")
 
-        for i, analysis in enumerate(session.analyses):
-            logger.info(f"Verificando grano {i+1}...")
-
-            assert analysis.image_url is not None, \
-                "Cada análisis debe tener URL de imagen"
-            logger.info(f"  URL: {analysis.image_url}")
-
-            assert 'cloudinary.com' in analysis.image_url, \
-                f"URL debe ser de Cloudinary: {analysis.image_url}"
-            logger.info("  OK: URL de Cloudinary valida")
-
-            assert analysis.cloudinary_public_id is not None, \
-                "Cada análisis debe tener public_id de Cloudinary"
-            logger.info(f"  Public ID: {analysis.cloudinary_public_id}")
-
-        # Verificar que Cloudinary fue llamado
-        assert mock_cloudinary_service.upload_grain_image.called, \
-            "Cloudinary debe haber sido invocado"
-        logger.info(f"Cloudinary invocado {mock_cloudinary_service.upload_grain_image.call_count} veces")
-
-        assert mock_cloudinary_service.upload_grain_image.call_count == len(session.analyses), \
-            f"Cloudinary debe ser llamado una vez por grano ({len(session.analyses)} veces)"
+        analyses = session.analyses
+
+        # Primer análisis sin URL pública de Cloudinary o sin public_id (None si todos son válidos)
+        bad = next(
+            (
+                a for a in analyses
+                if a.image_url is None
+                or 'cloudinary.com' not in a.image_url
+                or a.cloudinary_public_id is None
+            ),
+            None
+        )
+        assert bad is None, \
+            f"Análisis sin imagen válida en Cloudinary: url={bad.image_url}, public_id={bad.cloudinary_public_id}"
+        logger.info("OK: %s URLs de Cloudinary validas con public_id", len(analyses))
+
+        # Verificar que Cloudinary fue llamado una vez por grano
+        logger.info("Cloudinary invocado %s veces", upload_calls)
+        assert upload_calls == len(analyses), \
+            f"Cloudinary debe ser llamado una vez por grano ({len(analyses)} veces)"
         logger.info("OK: Imagenes almacenadas correctamente en Cloudinary")
 
     def test_tiempo_procesamiento_registrado(
             self,
-            classification_service,
-            sample_image_bytes
+            default_session
     ):
         """
         Verifica que el tiempo de procesamiento se registre correctamente.
@@ -378,23 +291,19 @@ class TestUS14ClasificacionEstandaresInternacionales:
         """
         logger.info("=== TEST: Registro de tiempo de procesamiento ===")
 
-        # Act: Procesar clasificación
-        logger.info("ACT: Procesando clasificacion con medicion de tiempo")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        # Act: Sesión compartida por la clase (fixture default_session)
+        session = default_session
+        logger.info("Sesion creada con status: %s", session.status)
 
         # Assert: Verificar tiempo registrado
         logger.info("ASSERT: Verificando registro de tiempo de procesamiento")
-        assert session.status == SessionStatus.COMPLETED
+        assert session.status is _COMPLETED
+        assert session.analyses, "La sesión debe tener análisis de granos"
         logger.info("OK: Sesion completada")
 
         assert session.processing_time_seconds is not None, \
             "Debe existir tiempo de procesamiento"
-        logger.info(f"Tiempo de procesamiento: {session.processing_time_seconds:.3f} segundos")
+        logger.info("Tiempo de procesamiento: %.3f segundos", session.processing_time_seconds)
 
         assert session.processing_time_seconds > 0, \
             f"Tiempo debe ser positivo, obtuvo: {session.processing_time_seconds}"
@@ -407,9 +316,7 @@ class TestUS14ClasificacionEstandaresInternacionales:
 
     def test_persistencia_sesion_completa(
             self,
-            classification_service,
-            mock_db_session,
-            sample_image_bytes
+            default_run
     ):
         """
         Verifica que la sesión completa se persista correctamente en la base de datos.
@@ -420,33 +327,22 @@ class TestUS14ClasificacionEstandaresInternacionales:
         """
         logger.info("=== TEST: Persistencia de sesion completa en BD ===")
 
-        # Act: Procesar clasificación
-        logger.info("ACT: Procesando clasificacion con persistencia")
-        session = classification_service.start_classification_session(
-            coffee_lot_id=1,
-            image_bytes=sample_image_bytes,
-            user_id=1
-        )
-        logger.info(f"Sesion creada con status: {session.status}")
+        # Act: Sesión compartida por la clase con sus llamadas a BD registradas (fixture default_run)
+        session, db_calls, _ = default_run
+        logger.info("Sesion creada con status: %s", session.status)
 
         # Assert: Verificar persistencia
         logger.info("ASSERT: Verificando operaciones de persistencia en BD")
 
-        assert mock_db_session.add.called, \
-            "Session.add() debe haber sido llamado"
-        logger.info("OK: Session.add() fue invocado")
-
-        assert mock_db_session.commit.called, \
-            "Session.commit() debe haber sido llamado"
-        logger.info("OK: Session.commit() fue invocado")
-
-        assert mock_db_session.refresh.called, \
-            "Session.refresh() debe haber sido llamado"
-        logger.info("OK: Session.refresh() fue invocado")
+        called_methods = {name for name, _, _ in db_calls}
+        for method in ('add', 'commit', 'refresh'):
+            assert method in called_methods, \
+                f"Session.{method}() debe haber sido llamado"
+            logger.info("OK: Session.%s() fue invocado", method)
 
         # Verificar que se agregó la sesión correcta
-        added_session = mock_db_session.add.call_args[0][0]
-        logger.info(f"Tipo de objeto agregado: {type(added_session).__name__}")
+        added_session = next(args[0] for name, args, _ in db_calls if name == 'add')
+        logger.info("Tipo de objeto agregado: %s", type(added_session).__name__)
 
         assert isinstance(added_session, ClassificationSession), \
             f"Debe agregarse ClassificationSession, obtuvo: {type(added_session)}"
@@ -454,5 +350,5 @@ class TestUS14ClasificacionEstandaresInternacionales:
 
         assert len(added_session.analyses) > 0, \
             "La sesión debe contener análisis de granos"
-        logger.info(f"Analisis contenidos en la sesion: {len(added_session.analyses)}")
+        logger.info("Analisis contenidos en la sesion: %s", len(added_session.analyses))
         logger.info("OK: Sesion completa persistida correctamente en BD")
\ No newline at end of file
@@ -14,15 +14,29 @@ Criterios de Aceptación:
 - El reporte es fácil de interpretar
 """
 
+import bisect
 import pytest
 from datetime import datetime
-from typing import Dict, List
+from typing import Callable, Dict, List
+
+
+# Distribuciones de calidad de los lotes de prueba (100 granos cada uno)
+_DIST_ALTA_CALIDAD = {'Premium': 25, 'Excelente': 35, 'Muy Bueno': 20, 'Bueno': 15, 'Regular': 5}
+_DIST_CALIDAD_MIXTA = {
+    'Premium': 10, 'Excelente': 15, 'Muy Bueno': 20, 'Bueno': 30, 'Regular': 20, 'Defectuoso': 5
+}
+_DIST_BAJA_CALIDAD = {'Premium': 5, 'Excelente': 10, 'Bueno': 35, 'Regular': 35, 'Defectuoso': 15}
+
+# Lotes de prueba: (session_id, distribución de calidad, score promedio)
+_LOTE_ALTA_CALIDAD = ("SESS-2024-001", _DIST_ALTA_CALIDAD, 0.85)
+_LOTE_CALIDAD_MIXTA = ("SESS-2024-002", _DIST_CALIDAD_MIXTA, 0.65)
+_LOTE_BAJA_CALIDAD = ("SESS-2024-003", _DIST_BAJA_CALIDAD, 0.45)
 
 
 class MockClassificationSession:
     """Mock de una sesión de clasificación para tests"""
     def __init__(self, session_id: str, quality_distribution: Dict[str, int], 
-                 average_score: float, total_beans: int):
+                 average_score: float, total_beans: int, completed_at: datetime = None):
         self.session_id_vo = session_id
         self.classification_result = {
             'quality_distribution': quality_distribution,
@@ -31,7 +45,19 @@ class MockClassificationSession:
         }
         self.total_grains_analyzed = total_beans
         self.status = "COMPLETED"
-        self.completed_at = datetime.now()
+        self.completed_at = datetime.now() if completed_at is None else completed_at
+
+
+def _build_session(lote: tuple, completed_at: datetime) -> MockClassificationSession:
+    """Construye la sesión de 100 granos de uno de los lotes de prueba."""
+    session_id, quality_distribution, average_score = lote
+    return MockClassificationSession(
+        session_id=session_id,
+        quality_distribution=quality_distribution,
+        average_score=average_score,
+        total_beans=100,
+        completed_at=completed_at
+    )
 
 
 class ReporteSimpleService:
@@ -41,14 +67,21 @@ class ReporteSimpleService:
     """
     
     # Categorías aptas para exportación (alta calidad)
-    EXPORT_CATEGORIES = ['Premium', 'Excelente', 'Muy Bueno', 'Specialty']
+    EXPORT_CATEGORIES = frozenset(('Premium', 'Excelente', 'Muy Bueno', 'Specialty'))
     
     # Categorías para mercado local (calidad estándar)
-    LOCAL_MARKET_CATEGORIES = ['Bueno', 'Regular', 'Defectuoso']
+    LOCAL_MARKET_CATEGORIES = frozenset(('Bueno', 'Regular', 'Defectuoso'))
+    
+    # Umbrales mínimos (%) de exportación, en orden ascendente, y grado de cada tramo:
+    # EXPORT_GRADES[i] cubre desde GRADE_THRESHOLDS[i - 1] (inclusive) hasta GRADE_THRESHOLDS[i]
+    GRADE_THRESHOLDS = (60, 70, 80, 90)
+    EXPORT_GRADES = ("STANDARD", "GRADE_B", "GRADE_A", "PREMIUM", "SPECIALTY")
     
-    def generate_simple_report(self, session: MockClassificationSession) -> Dict:
+    def generate_simple_report(self, session: MockClassificationSession,
+                               now: Callable[[], datetime] = datetime.now) -> Dict:
         """
         Genera un reporte simple mostrando porcentaje de exportación vs local.
+        El reloj `now` fija la marca de tiempo del reporte (inyectable en tests).
         """
         quality_dist = session.classification_result.get('quality_distribution', {})
         total_beans = session.total_grains_analyzed
@@ -65,19 +98,18 @@ class ReporteSimpleService:
                 'recommendation': 'Sin datos para analizar'
             }
         
-        # Calcular granos para exportación
-        export_beans = sum(
-            quality_dist.get(cat, 0) for cat in self.EXPORT_CATEGORIES
-        )
-        
-        # Calcular granos para mercado local
-        local_beans = sum(
-            quality_dist.get(cat, 0) for cat in self.LOCAL_MARKET_CATEGORIES
-        )
+        # Calcular granos para exportación y mercado local en una sola pasada
+        export_beans = local_beans = 0
+        for cat, count in quality_dist.items():
+            if cat in self.EXPORT_CATEGORIES:
+                export_beans += count
+            elif cat in self.LOCAL_MARKET_CATEGORIES:
+                local_beans += count
         
         # Calcular porcentajes
-        export_percentage = round((export_beans / total_beans) * 100, 2)
-        local_percentage = round((local_beans / total_beans) * 100, 2)
+        scale = 100 / total_beans
+        export_percentage = round(export_beans * scale, 2)
+        local_percentage = round(local_beans * scale, 2)
         
         # Generar recomendación
         if export_percentage >= 80:
@@ -98,21 +130,12 @@ class ReporteSimpleService:
             'local_beans': local_beans,
             'quality_summary': quality_dist,
             'recommendation': recommendation,
-            'generated_at': datetime.now().isoformat()
+            'generated_at': now().isoformat()
         }
     
     def get_export_grade(self, export_percentage: float) -> str:
         """Obtiene el grado de exportación basado en el porcentaje."""
-        if export_percentage >= 90:
-            return "SPECIALTY"
-        elif export_percentage >= 80:
-            return "PREMIUM"
-        elif export_percentage >= 70:
-            return "GRADE_A"
-        elif export_percentage >= 60:
-            return "GRADE_B"
-        else:
-            return "STANDARD"
+        return self.EXPORT_GRADES[bisect.bisect_right(self.GRADE_THRESHOLDS, export_percentage)]
 
 
 class TestUS15ReporteSimpleClasificacion:
@@ -127,99 +150,51 @@ class TestUS15ReporteSimpleClasificacion:
         return ReporteSimpleService()
     
     @pytest.fixture
-    def session_alta_calidad(self):
-        """Fixture: Sesión con alta calidad (apta para exportación)."""
-        return MockClassificationSession(
-            session_id="SESS-2024-001",
-            quality_distribution={
-                'Premium': 25,
-                'Excelente': 35,
-                'Muy Bueno': 20,
-                'Bueno': 15,
-                'Regular': 5
-            },
-            average_score=0.85,
-            total_beans=100
-        )
-    
-    @pytest.fixture
-    def session_calidad_mixta(self):
-        """Fixture: Sesión con calidad mixta."""
-        return MockClassificationSession(
-            session_id="SESS-2024-002",
-            quality_distribution={
-                'Premium': 10,
-                'Excelente': 15,
-                'Muy Bueno': 20,
-                'Bueno': 30,
-                'Regular': 20,
-                'Defectuoso': 5
-            },
-            average_score=0.65,
-            total_beans=100
-        )
+    def frozen_now(self):
+        """Fixture: Reloj fijo para reportes y sesiones deterministas."""
+        return lambda: datetime(2024, 1, 1)
     
     @pytest.fixture
-    def session_baja_calidad(self):
-        """Fixture: Sesión con baja calidad (mercado local)."""
-        return MockClassificationSession(
-            session_id="SESS-2024-003",
-            quality_distribution={
-                'Premium': 5,
-                'Excelente': 10,
-                'Bueno': 35,
-                'Regular': 35,
-                'Defectuoso': 15
-            },
-            average_score=0.45,
-            total_beans=100
-        )
-    
-    def test_reporte_porcentaje_exportacion_alta_calidad(self, reporte_service, session_alta_calidad):
-        """
-        Test: Verifica cálculo correcto del porcentaje de exportación 
-        para lote de alta calidad.
-        """
-        # Act
-        reporte = reporte_service.generate_simple_report(session_alta_calidad)
-        
-        # Assert
-        assert reporte['export_percentage'] == 80.0  # Premium(25) + Excelente(35) + MuyBueno(20)
-        assert reporte['local_market_percentage'] == 20.0  # Bueno(15) + Regular(5)
-        assert reporte['export_beans'] == 80
-        assert reporte['local_beans'] == 20
-        assert 'exportación' in reporte['recommendation'].lower()
+    def session_alta_calidad(self, frozen_now):
+        """Fixture: Sesión con alta calidad (apta para exportación)."""
+        return _build_session(_LOTE_ALTA_CALIDAD, frozen_now())
     
-    def test_reporte_porcentaje_mercado_local(self, reporte_service, session_baja_calidad):
+    @pytest.mark.parametrize("lote,expected_export,expected_local,keyword", [
+        # Premium(25) + Excelente(35) + MuyBueno(20) vs Bueno(15) + Regular(5)
+        (_LOTE_ALTA_CALIDAD, 80.0, 20.0, 'exportación'),
+        # Premium(10) + Excelente(15) + MuyBueno(20) vs Bueno(30) + Regular(20) + Defectuoso(5)
+        (_LOTE_CALIDAD_MIXTA, 45.0, 55.0, 'mixto'),
+        # Premium(5) + Excelente(10) vs Bueno(35) + Regular(35) + Defectuoso(15)
+        (_LOTE_BAJA_CALIDAD, 15.0, 85.0, 'local'),
+    ], ids=["alta_calidad", "calidad_mixta", "baja_calidad"])
+    def test_reporte_porcentajes_exportacion_mercado_local(self, reporte_service, frozen_now, lote,
+                                                          expected_export, expected_local, keyword):
         """
-        Test: Verifica cálculo correcto del porcentaje de mercado local
-        para lote de baja calidad.
+        Test: Verifica el cálculo de los porcentajes de exportación y mercado local,
+        que ambos suman 100% y la recomendación para cada nivel de calidad del lote.
         """
-        # Act
-        reporte = reporte_service.generate_simple_report(session_baja_calidad)
+        # Arrange
+        session = _build_session(lote, frozen_now())
         
-        # Assert
-        assert reporte['export_percentage'] == 15.0  # Premium(5) + Excelente(10)
-        assert reporte['local_market_percentage'] == 85.0  # Bueno(35) + Regular(35) + Defectuoso(15)
-        assert 'local' in reporte['recommendation'].lower()
-    
-    def test_reporte_suma_porcentajes_100(self, reporte_service, session_calidad_mixta):
-        """
-        Test: Verifica que los porcentajes de exportación y local suman 100%.
-        """
         # Act
-        reporte = reporte_service.generate_simple_report(session_calidad_mixta)
+        reporte = reporte_service.generate_simple_report(session, now=frozen_now)
         
         # Assert
+        assert reporte['export_percentage'] == expected_export
+        assert reporte['local_market_percentage'] == expected_local
+        # Lote de 100 granos: el número de granos coincide con el porcentaje
+        assert reporte['export_beans'] == expected_export
+        assert reporte['local_beans'] == expected_local
         total = reporte['export_percentage'] + reporte['local_market_percentage']
         assert total == 100.0, f"Los porcentajes deben sumar 100%, suma actual: {total}"
+        assert keyword in reporte['recommendation'].lower()
     
-    def test_reporte_incluye_resumen_calidad(self, reporte_service, session_alta_calidad):
+    def test_reporte_incluye_resumen_calidad(self, reporte_service, session_alta_calidad, frozen_now):
         """
         Test: Verifica que el reporte incluye resumen de calidad por categorías.
         """
         # Act
-        reporte = reporte_service.generate_simple_report(session_alta_calidad)
+        reporte = reporte_service.generate_simple_report(session_alta_calidad, now=frozen_now)
         
         # Assert
         assert 'quality_summary' in reporte
@@ -227,12 +202,12 @@ class TestUS15ReporteSimpleClasificacion:
         assert len(reporte['quality_summary']) > 0
         assert 'Premium' in reporte['quality_summary']
     
-    def test_reporte_facil_interpretacion(self, reporte_service, session_alta_calidad):
+    def test_reporte_facil_interpretacion(self, reporte_service, session_alta_calidad, frozen_now):
         """
         Test: Verifica que el reporte es fácil de interpretar con todos los campos necesarios.
         """
         # Act
-        reporte = reporte_service.generate_simple_report(session_alta_calidad)
+        reporte = reporte_service.generate_simple_report(session_alta_calidad, now=frozen_now)
         
         # Assert - Todos los campos esenciales deben estar presentes
         campos_requeridos = [
@@ -242,19 +217,22 @@ class TestUS15ReporteSimpleClasificacion:
         ]
         for campo in campos_requeridos:
             assert campo in reporte, f"Falta el campo: {campo}"
+        
+        # La marca de tiempo del reporte proviene del reloj inyectado
+        assert reporte['generated_at'] == frozen_now().isoformat()
     
-    def test_reporte_grado_exportacion(self, reporte_service, session_alta_calidad):
+    def test_reporte_grado_exportacion(self, reporte_service, session_alta_calidad, frozen_now):
         """
         Test: Verifica la asignación correcta del grado de exportación.
         """
         # Act
-        reporte = reporte_service.generate_simple_report(session_alta_calidad)
+        reporte = reporte_service.generate_simple_report(session_alta_calidad, now=frozen_now)
         grado = reporte_service.get_export_grade(reporte['export_percentage'])
         
         # Assert
         assert grado == "PREMIUM"  # 80% = PREMIUM
     
-    def test_reporte_session_sin_granos(self, reporte_service):
+    def test_reporte_session_sin_granos(self, reporte_service, frozen_now):
         """
         Test: Verifica comportamiento con sesión sin granos analizados.
         """
@@ -263,11 +241,12 @@ class TestUS15ReporteSimpleClasificacion:
             session_id="SESS-2024-EMPTY",
             quality_distribution={},
             average_score=0,
-            total_beans=0
+            total_beans=0,
+            completed_at=frozen_now()
         )
         
         # Act
-        reporte = reporte_service.generate_simple_report(session_vacia)
+        reporte = reporte_service.generate_simple_report(session_vacia, now=frozen_now)
         
         # Assert
         assert reporte['export_percentage'] == 0